@@ -277,6 +277,22 @@ EVALUATOR_REGISTRY = {
     "length": LengthEvaluator,
 }
 
+# Shared instances, one per registered type. The evaluators keep no
+# per-call state, so evaluate_result reuses them across test cases
+# instead of constructing a fresh object per config on every call —
+# and SemanticSimilarityEvaluator's lazily loaded model survives
+# between cases instead of being thrown away with each instance.
+_EVALUATOR_INSTANCES: Dict[str, BaseEvaluator] = {}
+
+
+def _get_evaluator(eval_type: str) -> BaseEvaluator:
+    evaluator = _EVALUATOR_INSTANCES.get(eval_type)
+    if evaluator is None:
+        evaluator = _EVALUATOR_INSTANCES.setdefault(
+            eval_type, EVALUATOR_REGISTRY[eval_type]()
+        )
+    return evaluator
+
 
 def evaluate_result(
     output: str,
@@ -325,7 +341,7 @@ def evaluate_result(
                 ))
                 continue
         elif eval_type in EVALUATOR_REGISTRY:
-            evaluator = EVALUATOR_REGISTRY[eval_type]()
+            evaluator = _get_evaluator(eval_type)
         else:
             results.append(EvalResult(
                 passed=False,
@@ -7,56 +7,388 @@ Run with: streamlit run human_review_app.py
 
 import streamlit as st
 import json
+import orjson
+import os
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from collections import deque
 from datetime import datetime
 from typing import Dict, List, Optional
 import csv
 import re
 
+# File locking is POSIX-only; on Windows (run-local.bat) writes fall back
+# to unlocked but still atomic-rename semantics
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 # Import smart storage (auto-detects environment)
 from smart_storage import SmartStorage
 
+# Optional C-backed HTML parser for scrubbing highlight spans.
+# Falls back to the regex path when selectolax isn't installed.
+try:
+    from selectolax.parser import HTMLParser as _HTMLParser
+except ImportError:
+    _HTMLParser = None
+
 # Initialize storage
 # - Local dev: Uses JSON file (fast, no setup)
 # - Production: Uses MongoDB (persistent, set MONGODB_URI env var)
 storage = SmartStorage()
 
+# The backend never changes within a process, so derive the label once
+# instead of probing hasattr on every rerun
+STORAGE_TYPE = "MongoDB" if hasattr(storage.backend, 'db') else "JSON"
+
+# Queue file locations, built once per process; the directory is created
+# here so every entry point (streamlit run, imports) gets it
+REVIEW_DIR = Path("review_data")
+REVIEW_DIR.mkdir(exist_ok=True)
+PENDING_FILE = REVIEW_DIR / "pending_reviews.json"
+BACKUP_FILE = REVIEW_DIR / "master_reviews_backup.json"
+REVIEWED_LOG = REVIEW_DIR / "reviewed_ids.log"
+# OpenGov captures append here (see opengov_integration.py); the app
+# folds them into PENDING_FILE before reading the queue
+CAPTURE_LOG = REVIEW_DIR / "pending_reviews.jsonl"
+
+# Custom CSS for dark theme (module-level constant so the string is built
+# once per process, not re-templated on every rerun)
+_CSS = """
+    <style>
+    /* Dark theme */
+    .stApp {
+        background-color: #0e1117;
+    }
+
+    /* Hide default Streamlit elements */
+    #MainMenu {visibility: hidden;}
+    footer {visibility: hidden;}
+    header {visibility: hidden;}
+
+    /* Custom styling */
+    .main-title {
+        font-size: 18px;
+        color: #cccccc;
+        margin-bottom: 20px;
+    }
+
+    .conversation-box {
+        background-color: #1a1d24;
+        padding: 15px;
+        border-radius: 8px;
+        margin: 10px 0;
+        border-left: 3px solid #333;
+    }
+
+    .user-msg {
+        color: #e0e0e0;
+        font-size: 14px;
+        margin-bottom: 10px;
+    }
+
+    .assistant-msg {
+        color: #b0b0b0;
+        font-size: 14px;
+        background-color: #0e1117;
+        padding: 12px;
+        border-radius: 6px;
+        margin-top: 8px;
+    }
+
+    .label-text {
+        color: #888;
+        font-size: 12px;
+        margin-bottom: 8px;
+        margin-top: 15px;
+        font-weight: 500;
+    }
+
+    /* Reviewer input styling */
+    .stTextInput input {
+        background-color: #1a1d24 !important;
+        border: 1px solid #333 !important;
+        border-radius: 6px !important;
+        color: #e0e0e0 !important;
+        padding: 8px 12px !important;
+        font-size: 13px !important;
+    }
+
+    .stTextInput input:focus {
+        border-color: #555 !important;
+        box-shadow: none !important;
+    }
+
+    /* Top bar spacing */
+    .block-container {
+        padding-top: 2rem !important;
+    }
+
+    /* Button styling */
+    .stButton>button {
+        background-color: #2d3139;
+        color: white;
+        border: none;
+        border-radius: 6px;
+    }
+
+    .stButton>button:hover {
+        background-color: #3d4149;
+    }
+
+    /* Fix barely visible metrics */
+    [data-testid="stMetricValue"] {
+        color: #ffffff !important;
+        font-size: 24px !important;
+        font-weight: 600 !important;
+    }
+
+    [data-testid="stMetricLabel"] {
+        color: #cccccc !important;
+        font-size: 14px !important;
+    }
+
+    [data-testid="stMetricDelta"] {
+        color: #aaaaaa !important;
+    }
+
+    /* Fix tab text visibility */
+    .stTabs [data-baseweb="tab-list"] button {
+        color: #cccccc !important;
+    }
+
+    .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
+        color: #ffffff !important;
+    }
+
+    /* Fix text input and text area */
+    .stTextInput input, .stTextArea textarea {
+        color: #ffffff !important;
+        background-color: #1a1d24 !important;
+    }
+
+    /* Fix multiselect */
+    .stMultiSelect [data-baseweb="select"] {
+        color: #ffffff !important;
+    }
+
+    /* Expander styling */
+    .streamlit-expanderHeader {
+        color: #ffffff !important;
+    }
+
+    /* Popover styling for settings menu */
+    [data-testid="stPopover"] {
+        background-color: #1a1d24 !important;
+    }
+
+    [data-testid="stPopover"] button {
+        font-size: 20px !important;
+        padding: 8px 12px !important;
+    }
+
+    /* Style the popover content */
+    div[data-baseweb="popover"] {
+        background-color: #1a1d24 !important;
+    }
+    </style>
+"""
+
+
+# Highlight-stripping pattern for the regex fallback path, compiled once at
+# import. A single pattern covers both the "background-color among other
+# styles" and "background-color is the only style" cases, so the response
+# text is scanned once instead of twice.
+_HIGHLIGHT_RE = re.compile(
+    r'<span\s+style="[^"]*background-color:\s*rgb\([^)]+\)[^"]*"\s*>(.*?)</span>',
+    re.IGNORECASE | re.DOTALL
+)
+
 
 def remove_highlighting(html_text: str) -> str:
     """Remove yellow/background-color highlighting from HTML text"""
     if not html_text:
         return html_text
-    
-    # Remove inline background-color styles from span tags
-    # This pattern matches style attributes that contain background-color
-    html_text = re.sub(
-        r'<span\s+style="[^"]*background-color:\s*rgb\([^)]+\);[^"]*">(.*?)</span>',
-        r'\1',
-        html_text,
-        flags=re.IGNORECASE
-    )
-    
-    # Also handle cases where background-color is the only style
-    html_text = re.sub(
-        r'<span\s+style="background-color:\s*rgb\([^)]+\);">(.*?)</span>',
-        r'\1',
-        html_text,
-        flags=re.IGNORECASE
-    )
-    
-    return html_text
+
+    # Fast path: most responses carry no highlighting at all, and this
+    # C-level substring scan (str's FASTSEARCH) rules that out without
+    # touching the parser or regex engine
+    if 'background-color' not in html_text:
+        return html_text
+
+    # Prefer a proper HTML tree-walk over regex when selectolax is available:
+    # unwrap highlighted spans in place, keeping their children
+    if _HTMLParser is not None:
+        tree = _HTMLParser(html_text)
+        for span in tree.css('span[style*="background-color"]'):
+            span.unwrap()
+        body = tree.body
+        if body is None or body.html is None:
+            return html_text
+        inner = body.html
+        # Strip the synthetic <body> wrapper added by the parser
+        if inner.startswith('<body>') and inner.endswith('</body>'):
+            inner = inner[6:-7]
+        return inner
+
+    # Unwrap highlighted spans in a single linear scan
+    return _HIGHLIGHT_RE.sub(r'\1', html_text)
+
+
+# Rewrite pending_reviews.json once this many tombstones accumulate
+_COMPACT_THRESHOLD = 500
+
+
+class _queue_lock:
+    """
+    Exclusive lock over the review queue so concurrent reviewer sessions
+    can't interleave read-modify-write cycles on the same files.
+    """
+
+    def __init__(self, pending_file: Path):
+        self._lock_path = pending_file.with_suffix('.lock')
+        self._fh = None
+
+    def __enter__(self):
+        self._fh = open(self._lock_path, 'w')
+        if fcntl is not None:
+            fcntl.flock(self._fh.fileno(), fcntl.LOCK_EX)
+        return self
+
+    def __exit__(self, *exc):
+        self._fh.close()
+        self._fh = None
+        return False
+
+
+def _write_pending_atomic(pending_file: Path, pending: List[Dict]):
+    """Rewrite the queue via a temp file + rename so readers never see a
+    partially written JSON array."""
+    tmp = pending_file.with_suffix('.tmp')
+    tmp.write_bytes(orjson.dumps(pending, option=orjson.OPT_INDENT_2))
+    os.replace(tmp, pending_file)
+
+
+@st.cache_data(show_spinner=False)
+def _load_pending_cached(path: str, mtime: float) -> List[Dict]:
+    """Parse the pending-reviews file; memoized on (path, mtime)"""
+    with open(path, 'rb') as f:
+        return orjson.loads(f.read())
+
+
+def _load_reviewed_ids() -> set:
+    """
+    Load the set of tombstoned review ids from the append-only log.
+
+    Cached in session state keyed on the log's size (valid because the log
+    is append-only), so the several callers per rerun share one read.
+    """
+    try:
+        size = os.stat(REVIEWED_LOG).st_size
+    except FileNotFoundError:
+        return set()
+
+    cached = st.session_state.get('_reviewed_ids_cache')
+    if cached is not None and cached[0] == size:
+        return cached[1]
+
+    with open(REVIEWED_LOG) as f:
+        reviewed = {line.strip() for line in f if line.strip()}
+    st.session_state['_reviewed_ids_cache'] = (size, reviewed)
+    return reviewed
+
+
+def _fold_captures():
+    """
+    Fold un-compacted OpenGov captures into pending_reviews.json.
+
+    capture() appends to the JSONL sidecar so the write path stays O(1);
+    the app is the consumer, so it runs the compaction before reading
+    the queue. A stat guard keeps the common no-captures case free.
+    """
+    try:
+        if CAPTURE_LOG.stat().st_size == 0:
+            return
+    except FileNotFoundError:
+        return
+
+    from opengov_integration import OpenGovReviewCapture
+    OpenGovReviewCapture(str(PENDING_FILE)).compact()
 
 
 def load_pending_reviews() -> List[Dict]:
     """Load responses that need review"""
-    pending_file = Path("review_data/pending_reviews.json")
-    
-    if not pending_file.exists():
+    _fold_captures()
+    pending_file = PENDING_FILE
+
+    # EAFP: one stat covers both the existence check and the cache key
+    try:
+        mtime = pending_file.stat().st_mtime
+    except FileNotFoundError:
         return []
-    
-    with open(pending_file) as f:
-        return json.load(f)
+
+    # Keyed on mtime: reruns that didn't change the file skip the JSON parse
+    pending = _load_pending_cached(str(pending_file), mtime)
+
+    # Filter lazily against the tombstone log instead of rewriting the
+    # queue file on every submission
+    reviewed = _load_reviewed_ids()
+    if reviewed:
+        pending = [r for r in pending if r.get('id') not in reviewed]
+
+    return pending
+
+
+def load_head_review() -> Optional[Dict]:
+    """
+    Return the first pending review without materializing the whole queue.
+
+    Streams items out of the JSON array with JSONDecoder.raw_decode and
+    stops at the first item that isn't tombstoned, so a cold load only
+    pays to parse the head instead of the full list.
+    """
+    _fold_captures()
+    try:
+        text = PENDING_FILE.read_text()
+    except FileNotFoundError:
+        return None
+
+    start = text.find('[')
+    if start == -1:
+        return None
+
+    reviewed = _load_reviewed_ids()
+    decoder = json.JSONDecoder()
+    idx = start + 1
+    end = len(text)
+
+    while True:
+        while idx < end and text[idx] in ' \t\r\n,':
+            idx += 1
+        if idx >= end or text[idx] == ']':
+            return None
+        try:
+            item, idx = decoder.raw_decode(text, idx)
+        except ValueError:
+            return None
+        if item.get('id') not in reviewed:
+            return item
+
+
+def count_pending() -> int:
+    """Number of items still awaiting review (mtime-cached full parse)"""
+    return len(load_pending_reviews())
+
+
+def _clear_reviewed_log():
+    """Drop the tombstone log (after compaction or a queue reset)"""
+    log_file = REVIEWED_LOG
+    if log_file.exists():
+        log_file.unlink()
+    st.session_state.pop('_reviewed_ids_cache', None)
 
 
 def reload_pending_reviews():
@@ -70,8 +402,8 @@ def reload_pending_reviews():
     3. Reload from backup when queue is empty
     """
     try:
-        pending_file = Path("review_data/pending_reviews.json")
-        backup_file = Path("review_data/master_reviews_backup.json")
+        pending_file = PENDING_FILE
+        backup_file = BACKUP_FILE
         
         # If backup doesn't exist, create it from current pending
         if not backup_file.exists() and pending_file.exists():
@@ -84,9 +416,11 @@ def reload_pending_reviews():
             import shutil
             shutil.copy(backup_file, pending_file)
             
-            with open(backup_file) as f:
-                items = json.load(f)
-            
+            items = orjson.loads(backup_file.read_bytes())
+
+            # Restored items must not stay hidden behind old tombstones
+            _clear_reviewed_log()
+            _load_pending_cached.clear()
             return True, f"✓ Reloaded {len(items)} items from backup"
         else:
             return False, "No backup found. Please run load_from_postgres.py first."
@@ -95,63 +429,106 @@ def reload_pending_reviews():
         return False, f"Error: {str(e)}"
 
 
-def mark_as_reviewed(review_id: str):
-    """Remove from pending after review"""
-    pending_file = Path("review_data/pending_reviews.json")
-    
-    if not pending_file.exists():
-        return
-    
-    with open(pending_file) as f:
-        pending = json.load(f)
-    
-    # Remove the reviewed item
-    pending = [r for r in pending if r.get('id') != review_id]
-    
-    with open(pending_file, 'w') as f:
-        json.dump(pending, f, indent=2)
+def mark_as_reviewed(review_ids):
+    """
+    Remove one or more reviews from pending after review
+
+    Accepts a single review id or any iterable of ids. Each submission is an
+    O(1) append to a tombstone log rather than a rewrite of the whole queue
+    file; the queue is compacted once enough tombstones accumulate.
+    """
+    if isinstance(review_ids, str):
+        review_ids = {review_ids}
+    else:
+        review_ids = set(review_ids)
+
+    pending_file = PENDING_FILE
+    with _queue_lock(pending_file):
+        # Union in memory instead of re-reading the log we just appended to
+        reviewed = _load_reviewed_ids() | review_ids
+        with open(REVIEWED_LOG, 'a') as f:
+            f.writelines(f"{rid}\n" for rid in review_ids)
+        st.session_state['_reviewed_ids_cache'] = (
+            os.stat(REVIEWED_LOG).st_size, reviewed)
+
+        if len(reviewed) > _COMPACT_THRESHOLD:
+            _compact_pending(reviewed)
+
+
+def _compact_pending(reviewed: set):
+    """Fold the tombstone log back into pending_reviews.json
+
+    Callers must hold the queue lock.
+    """
+    pending_file = PENDING_FILE
+
+    if pending_file.exists():
+        # Usually a cache hit: the mtime hasn't changed since the last load
+        pending = _load_pending_cached(str(pending_file), pending_file.stat().st_mtime)
+
+        pending = [r for r in pending if r.get('id') not in reviewed]
+
+        _write_pending_atomic(pending_file, pending)
+
+    _clear_reviewed_log()
+    _load_pending_cached.clear()
+
+
+@st.fragment
+def _controls_popover():
+    """
+    Controls popover contents, isolated in a fragment so typing a name or
+    opening the menu reruns only this subtree instead of the whole script
+    (queue load, conversation render, results tables).
+    """
+    with st.popover("⚙️", use_container_width=True):
+        st.markdown("### Settings")
+
+        # Reviewer identification lives in the top-bar input on the review
+        # page; a second text_input bound to the same state key would race
+        # with it and double rerun work
+        st.caption(f"👤 Reviewer: {st.session_state.get('reviewer_name', 'anonymous')}")
+
+        st.markdown("---")
+        st.markdown("**🔄 Reset Queue**")
+        st.caption("Reload items to allow multiple reviewers to review the same data")
+
+        if st.button("🔄 Wipe & Reload Queue", use_container_width=True):
+            with st.spinner("Reloading from database..."):
+                success, message = reload_pending_reviews()
+                if success:
+                    st.success(message)
+                    st.info("Queue reset! Multiple reviewers can now review the same items.")
+                    # Full-app rerun: the review page outside this fragment
+                    # needs to pick up the reloaded queue
+                    st.rerun(scope="app")
+                else:
+                    st.error(message)
+
+        st.markdown("---")
+
+        # Show storage info
+        st.caption(f"💾 Storage: {STORAGE_TYPE}")
 
 
 def setup_controls_menu():
     """Setup controls menu in top right"""
     # Create columns to position the popover in top right
     col1, col2, col3 = st.columns([6, 1, 0.5])
-    
+
     with col3:
-        with st.popover("⚙️", use_container_width=True):
-            st.markdown("### Settings")
-            
-            # Reviewer identification
-            if 'reviewer_name' not in st.session_state:
-                st.session_state.reviewer_name = 'anonymous'
-            
-            reviewer_name = st.text_input(
-                "Your Name",
-                value=st.session_state.reviewer_name,
-                placeholder="Enter your name",
-                key="reviewer_name_input"
-            )
-            st.session_state.reviewer_name = reviewer_name
-            
-            st.markdown("---")
-            st.markdown("**🔄 Reset Queue**")
-            st.caption("Reload items to allow multiple reviewers to review the same data")
-            
-            if st.button("🔄 Wipe & Reload Queue", use_container_width=True):
-                with st.spinner("Reloading from database..."):
-                    success, message = reload_pending_reviews()
-                    if success:
-                        st.success(message)
-                        st.info("Queue reset! Multiple reviewers can now review the same items.")
-                        st.rerun()
-                    else:
-                        st.error(message)
-            
-            st.markdown("---")
-            
-            # Show storage info
-            storage_type = "MongoDB" if hasattr(storage.backend, 'db') else "JSON"
-            st.caption(f"💾 Storage: {storage_type}")
+        _controls_popover()
+
+
+def _inject_css():
+    """
+    Emit the dark-theme CSS for the current run.
+
+    This must run on every rerun — Streamlit drops elements that are not
+    re-emitted — so the saving comes from the module-level _CSS constant,
+    built once per process instead of re-templated per run.
+    """
+    st.markdown(_CSS, unsafe_allow_html=True)
 
 
 def main():
@@ -160,151 +537,17 @@ def main():
         page_icon="📝",
         layout="wide"
     )
-    
+
+    # One-shot session defaults instead of `if key not in session_state`
+    # blocks scattered through the widgets
+    for key, default in (('reviewer_name', 'anonymous'), ('score_choice', None)):
+        st.session_state.setdefault(key, default)
+
     # Setup controls menu in top right
     setup_controls_menu()
-    
-    # Custom CSS for dark theme
-    st.markdown("""
-        <style>
-        /* Dark theme */
-        .stApp {
-            background-color: #0e1117;
-        }
-        
-        /* Hide default Streamlit elements */
-        #MainMenu {visibility: hidden;}
-        footer {visibility: hidden;}
-        header {visibility: hidden;}
-        
-        /* Custom styling */
-        .main-title {
-            font-size: 18px;
-            color: #cccccc;
-            margin-bottom: 20px;
-        }
-        
-        .conversation-box {
-            background-color: #1a1d24;
-            padding: 15px;
-            border-radius: 8px;
-            margin: 10px 0;
-            border-left: 3px solid #333;
-        }
-        
-        .user-msg {
-            color: #e0e0e0;
-            font-size: 14px;
-            margin-bottom: 10px;
-        }
-        
-        .assistant-msg {
-            color: #b0b0b0;
-            font-size: 14px;
-            background-color: #0e1117;
-            padding: 12px;
-            border-radius: 6px;
-            margin-top: 8px;
-        }
-        
-        .label-text {
-            color: #888;
-            font-size: 12px;
-            margin-bottom: 8px;
-            margin-top: 15px;
-            font-weight: 500;
-        }
-        
-        /* Reviewer input styling */
-        .stTextInput input {
-            background-color: #1a1d24 !important;
-            border: 1px solid #333 !important;
-            border-radius: 6px !important;
-            color: #e0e0e0 !important;
-            padding: 8px 12px !important;
-            font-size: 13px !important;
-        }
-        
-        .stTextInput input:focus {
-            border-color: #555 !important;
-            box-shadow: none !important;
-        }
-        
-        /* Top bar spacing */
-        .block-container {
-            padding-top: 2rem !important;
-        }
-        
-        /* Button styling */
-        .stButton>button {
-            background-color: #2d3139;
-            color: white;
-            border: none;
-            border-radius: 6px;
-        }
-        
-        .stButton>button:hover {
-            background-color: #3d4149;
-        }
-        
-        /* Fix barely visible metrics */
-        [data-testid="stMetricValue"] {
-            color: #ffffff !important;
-            font-size: 24px !important;
-            font-weight: 600 !important;
-        }
-        
-        [data-testid="stMetricLabel"] {
-            color: #cccccc !important;
-            font-size: 14px !important;
-        }
-        
-        [data-testid="stMetricDelta"] {
-            color: #aaaaaa !important;
-        }
-        
-        /* Fix tab text visibility */
-        .stTabs [data-baseweb="tab-list"] button {
-            color: #cccccc !important;
-        }
-        
-        .stTabs [data-baseweb="tab-list"] button[aria-selected="true"] {
-            color: #ffffff !important;
-        }
-        
-        /* Fix text input and text area */
-        .stTextInput input, .stTextArea textarea {
-            color: #ffffff !important;
-            background-color: #1a1d24 !important;
-        }
-        
-        /* Fix multiselect */
-        .stMultiSelect [data-baseweb="select"] {
-            color: #ffffff !important;
-        }
-        
-        /* Expander styling */
-        .streamlit-expanderHeader {
-            color: #ffffff !important;
-        }
-        
-        /* Popover styling for settings menu */
-        [data-testid="stPopover"] {
-            background-color: #1a1d24 !important;
-        }
-        
-        [data-testid="stPopover"] button {
-            font-size: 20px !important;
-            padding: 8px 12px !important;
-        }
-        
-        /* Style the popover content */
-        div[data-baseweb="popover"] {
-            background-color: #1a1d24 !important;
-        }
-        </style>
-    """, unsafe_allow_html=True)
-    
+
+    _inject_css()
+
     # Top navigation tabs
     tab1, tab2 = st.tabs(["📝 Review", "📊 Results & Analytics"])
     
@@ -315,41 +558,110 @@ def main():
         show_results_page()
 
 
+def _build_conversation_html(current_review: Dict) -> str:
+    """Build the conversation HTML for a review (prompt, context, response)"""
+    parts = [f'''
+    <p class="label-text">Project Title</p>
+    <div class="conversation-box">
+        <p class="user-msg">{current_review.get("prompt", "")}</p>
+    </div>
+    ''']
+
+    # Context if exists
+    if current_review.get('context'):
+        context_html = f'<p class="user-msg" style="font-size: 12px; color: #888;">{current_review.get("context", "")}</p>'
+
+        # Add agency user and organization if available
+        if current_review.get('agency_user'):
+            context_html += f'<p class="user-msg" style="font-size: 12px; color: #888; margin-top: 5px;">Agency User: {current_review.get("agency_user")}</p>'
+        if current_review.get('organization_name'):
+            context_html += f'<p class="user-msg" style="font-size: 12px; color: #888; margin-top: 5px;">Organization: {current_review.get("organization_name")}</p>'
+
+        parts.append(f'''
+        <p class="label-text">Context</p>
+        <div class="conversation-box">
+            {context_html}
+        </div>
+        ''')
+
+    # Assistant response (with highlighting removed)
+    response_text = remove_highlighting(current_review.get("response", ""))
+    parts.append(f'''
+    <p class="label-text">Assistant</p>
+    <div class="conversation-box">
+        <div class="assistant-msg">{response_text}</div>
+    </div>
+    ''')
+
+    # Expected output if available
+    if current_review.get('expected_output'):
+        parts.append(f'''
+        <div class="conversation-box">
+            <p class="label-text">Expected</p>
+            <p class="user-msg" style="color: #4CAF50;">{current_review.get("expected_output", "")}</p>
+        </div>
+        ''')
+
+    return ''.join(parts)
+
+
+@st.fragment
+def _render_conversation(current_review: Dict):
+    """
+    Render the conversation panel in an isolated fragment.
+
+    The HTML is built once per review id and cached in session state, so
+    reruns triggered by the notes/tags widgets don't rebuild or re-hash
+    the (potentially multi-KB) markdown blocks.
+    """
+    cache_key = f'_conv_{current_review.get("id", "")}'
+    html = st.session_state.get(cache_key)
+    if html is None:
+        # Drop stale entries from previous reviews before caching the new one
+        for key in [k for k in st.session_state.keys() if k.startswith('_conv_')]:
+            del st.session_state[key]
+        html = _build_conversation_html(current_review)
+        st.session_state[cache_key] = html
+
+    st.markdown(html, unsafe_allow_html=True)
+
+
+@st.fragment
+def _reviewer_name_widget():
+    """Reviewer-name input, fragment-scoped so keystrokes don't rerun the page"""
+    st.markdown('<p style="color: #888; font-size: 11px; margin-bottom: 2px; margin-top: 5px;">Reviewer</p>', unsafe_allow_html=True)
+    reviewer_name = st.text_input(
+        "Reviewer",
+        value=st.session_state.reviewer_name,
+        key="reviewer_input",
+        label_visibility="collapsed",
+        placeholder="Enter your name..."
+    )
+    if reviewer_name:
+        st.session_state.reviewer_name = reviewer_name
+
+
 def show_review_page():
     """Main review interface"""
-    
-    # Load pending reviews
-    pending = load_pending_reviews()
-    
-    if not pending:
+
+    # Stream just the head of the queue instead of parsing the entire list
+    current_review = load_head_review()
+
+    if current_review is None:
         st.markdown('<p class="main-title">No pending reviews</p>', unsafe_allow_html=True)
         return
-    
-    # Get current review
-    current_review = pending[0]
+
+    remaining = count_pending()
     review_id = current_review.get('id', '')
     
     # Top bar with reviewer name
     col_title, col_spacer, col_user = st.columns([3, 1, 2])
     with col_title:
-        st.markdown(f'<p class="main-title">Human review - {len(pending)} remaining</p>', unsafe_allow_html=True)
+        st.markdown(f'<p class="main-title">Human review - {remaining} remaining</p>', unsafe_allow_html=True)
     with col_spacer:
-        st.markdown(f'<p style="text-align: center; color: #666; font-size: 12px; margin-top: 10px;">Item {1} of {len(pending)}</p>', unsafe_allow_html=True)
+        st.markdown(f'<p style="text-align: center; color: #666; font-size: 12px; margin-top: 10px;">Item {1} of {remaining}</p>', unsafe_allow_html=True)
     with col_user:
-        # Initialize reviewer name if not set
-        if 'reviewer_name' not in st.session_state:
-            st.session_state.reviewer_name = "anonymous"
-        
-        st.markdown('<p style="color: #888; font-size: 11px; margin-bottom: 2px; margin-top: 5px;">Reviewer</p>', unsafe_allow_html=True)
-        reviewer_name = st.text_input(
-            "Reviewer", 
-            value=st.session_state.reviewer_name,
-            key="reviewer_input",
-            label_visibility="collapsed",
-            placeholder="Enter your name..."
-        )
-        if reviewer_name:
-            st.session_state.reviewer_name = reviewer_name
+        _reviewer_name_widget()
     
     st.markdown("---")
     
@@ -357,47 +669,8 @@ def show_review_page():
     col1, col2 = st.columns([2.5, 1])
     
     with col1:
-        # Conversation display        
-        # Display prompt/user message
-        st.markdown(f'''
-        <p class="label-text">Project Title</p>
-        <div class="conversation-box">
-            <p class="user-msg">{current_review.get("prompt", "")}</p>
-        </div>
-        ''', unsafe_allow_html=True)
-        
-        # Display context if exists
-        if current_review.get('context'):
-            context_html = f'<p class="user-msg" style="font-size: 12px; color: #888;">{current_review.get("context", "")}</p>'
-            
-            # Add agency user and organization if available
-            if current_review.get('agency_user'):
-                context_html += f'<p class="user-msg" style="font-size: 12px; color: #888; margin-top: 5px;">Agency User: {current_review.get("agency_user")}</p>'
-            if current_review.get('organization_name'):
-                context_html += f'<p class="user-msg" style="font-size: 12px; color: #888; margin-top: 5px;">Organization: {current_review.get("organization_name")}</p>'
-            
-            st.markdown(f'''
-            <p class="label-text">Context</p>
-            <div class="conversation-box">
-                {context_html}
-            </div>
-            ''', unsafe_allow_html=True)
-        
-        # Display assistant response (with highlighting removed)
-        response_text = remove_highlighting(current_review.get("response", ""))
-        st.markdown(f'''
-        <p class="label-text">Assistant</p>
-        <div class="conversation-box">
-            <div class="assistant-msg">{response_text}</div>
-        </div>
-        ''', unsafe_allow_html=True)
-        
-        # Expected output if available
-        if current_review.get('expected_output'):
-            st.markdown('<div class="conversation-box">', unsafe_allow_html=True)
-            st.markdown('<p class="label-text">Expected</p>', unsafe_allow_html=True)
-            st.markdown(f'<p class="user-msg" style="color: #4CAF50;">{current_review.get("expected_output", "")}</p>', unsafe_allow_html=True)
-            st.markdown('</div>', unsafe_allow_html=True)
+        # Conversation display
+        _render_conversation(current_review)
     
     with col2:
         st.markdown("### Scores")
@@ -409,10 +682,7 @@ def show_review_page():
         with col_not:
             not_acceptable = st.button("✗ Not Acceptable", use_container_width=True, key="btn_not_acceptable")
         
-        # Store the choice
-        if 'score_choice' not in st.session_state:
-            st.session_state.score_choice = None
-        
+        # Store the choice (default set once in main())
         if acceptable:
             st.session_state.score_choice = "acceptable"
         elif not_acceptable:
@@ -478,6 +748,7 @@ def show_review_page():
             
             # Save to storage
             storage.save_review(review_data)
+            _reviews_df.clear()
             
             # Mark as reviewed
             mark_as_reviewed(review_id)
@@ -491,124 +762,153 @@ def show_review_page():
             st.rerun()
         
         if st.button("Skip", use_container_width=True):
-            # Move to end of queue
-            pending.append(pending.pop(0))
-            pending_file = Path("review_data/pending_reviews.json")
-            with open(pending_file, 'w') as f:
-                json.dump(pending, f, indent=2)
+            # Move to end of queue — deque.rotate is O(1) where
+            # list.pop(0) shifts every remaining element
+            dq = deque(load_pending_reviews())
+            dq.rotate(-1)
+            pending = list(dq)
+            pending_file = PENDING_FILE
+            with _queue_lock(pending_file):
+                _write_pending_atomic(pending_file, pending)
+                # The rewritten queue already excludes tombstoned items
+                _clear_reviewed_log()
+            _load_pending_cached.clear()
             st.rerun()
 
 
+@st.cache_data(ttl=30, show_spinner=False)
+def _reviews_df() -> pd.DataFrame:
+    """
+    Build the reviews DataFrame with a typed timestamp column.
+
+    Timestamps are stored as ISO strings; parse them once here to
+    datetime64[ns] so downstream pages get cheap .dt accessors instead of
+    re-parsing strings on every rerun.
+
+    Cached so tab switches and widget interactions don't re-hit storage;
+    the Submit handler clears it after saving, and the short TTL picks up
+    reviews submitted by other people.
+    """
+    df = pd.DataFrame(storage.get_all_reviews())
+
+    if 'timestamp' in df.columns:
+        df['timestamp'] = pd.to_datetime(df['timestamp'], format='ISO8601', cache=True)
+
+    # String-enum columns as categoricals: groupby/value_counts run on
+    # integer codes instead of hashing Python strings, and memory drops
+    # to one copy per distinct value
+    if 'reviewer' in df.columns:
+        # Fill before converting: categorical fillna rejects values
+        # that aren't already categories
+        df['reviewer'] = df['reviewer'].fillna('anonymous')
+    for col in ('reviewer', 'model', 'feature', 'organization_name'):
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    return df
+
+
 def show_results_page():
     """Results and Analytics page"""
-    
-    reviews = storage.get_all_reviews()
-    
-    if not reviews:
+
+    df = _reviews_df()
+
+    if df.empty:
         st.info("No reviews yet. Start reviewing to see results here.")
         return
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(reviews)
-    
-    # Detect duplicate reviews (same item reviewed by multiple people)
-    duplicate_reviews = {}
+
+    # Detect duplicate reviews (same item reviewed by multiple people).
+    # One groupby pass materializes every duplicate group up front instead
+    # of re-scanning the whole frame with boolean masks per duplicate id.
+    duplicate_groups = {}
     if 'review_id' in df.columns:
-        review_counts = df['review_id'].value_counts()
-        duplicates = review_counts[review_counts > 1]
-        if len(duplicates) > 0:
-            for review_id in duplicates.index:
-                reviewers = df[df['review_id'] == review_id]['reviewer'].tolist()
-                duplicate_reviews[review_id] = reviewers
+        duplicate_groups = {
+            review_id: group
+            for review_id, group in df.groupby('review_id')
+            if len(group) > 1
+        }
     
-    # Summary metrics
+    # Summary metrics, computed in one df.agg pass instead of separate
+    # column scans (this runs on every rerun of the Results tab)
+    agg_spec = {}
+    if 'acceptable' in df.columns:
+        agg_spec['acceptable'] = 'sum'
+    if 'organization_name' in df.columns:
+        agg_spec['organization_name'] = 'nunique'
+    stats = df.agg(agg_spec) if agg_spec else {}
+
+    total = len(df)
+    acceptable_count = int(stats.get('acceptable', 0))
+    orgs_count = int(stats.get('organization_name', 0))
+
     col1, col2, col3, col4 = st.columns(4)
-    
+
     with col1:
-        st.metric("Total Reviews", len(df))
-    
+        st.metric("Total Reviews", total)
+
     with col2:
-        acceptable_count = df['acceptable'].sum() if 'acceptable' in df.columns else 0
-        acceptable_pct = (acceptable_count / len(df) * 100) if len(df) > 0 else 0
+        acceptable_pct = (acceptable_count / total * 100) if total > 0 else 0
         st.metric("Acceptable", f"{acceptable_count}")
         st.caption(f"↑ {acceptable_pct:.0f}%")
-    
+
     with col3:
-        not_acceptable_count = len(df) - acceptable_count if 'acceptable' in df.columns else 0
+        not_acceptable_count = total - acceptable_count if 'acceptable' in df.columns else 0
         st.metric("Not Acceptable", f"{not_acceptable_count}")
-    
+
     with col4:
-        # Count unique organizations if available
-        orgs_count = df['organization_name'].nunique() if 'organization_name' in df.columns else 0
         st.metric("Organizations", orgs_count)
     
     # Show duplicate reviews if any
-    if duplicate_reviews:
+    if duplicate_groups:
         st.markdown("---")
         st.markdown("### 🔄 Multiple Reviews (Same Item)")
-        st.info(f"📊 {len(duplicate_reviews)} items have been reviewed by multiple people")
-        
-        with st.expander(f"View {len(duplicate_reviews)} items with multiple reviews"):
-            for review_id, reviewers in duplicate_reviews.items():
-                # Get the item details
-                item_reviews = df[df['review_id'] == review_id]
-                if len(item_reviews) > 0:
-                    first_review = item_reviews.iloc[0]
-                    prompt = first_review.get('prompt', 'Unknown')
-                    prompt_display = prompt[:80] + "..." if len(str(prompt)) > 80 else prompt
-                    
-                    st.markdown(f"**Item:** {prompt_display}")
-                    st.markdown(f"**Reviewed by:** {', '.join(set(reviewers))} ({len(reviewers)} reviews)")
-                    
-                    # Show agreement stats
-                    acceptable_votes = item_reviews['acceptable'].sum() if 'acceptable' in item_reviews.columns else 0
-                    agreement = f"{acceptable_votes}/{len(item_reviews)} found acceptable"
-                    st.caption(f"Agreement: {agreement}")
-                    st.markdown("---")
+        st.info(f"📊 {len(duplicate_groups)} items have been reviewed by multiple people")
+
+        with st.expander(f"View {len(duplicate_groups)} items with multiple reviews"):
+            for review_id, item_reviews in duplicate_groups.items():
+                reviewers = item_reviews['reviewer'].tolist()
+                first_review = item_reviews.iloc[0]
+                prompt = first_review.get('prompt', 'Unknown')
+                prompt_display = prompt[:80] + "..." if len(str(prompt)) > 80 else prompt
+
+                st.markdown(f"**Item:** {prompt_display}")
+                st.markdown(f"**Reviewed by:** {', '.join(set(reviewers))} ({len(reviewers)} reviews)")
+
+                # Show agreement stats
+                acceptable_votes = item_reviews['acceptable'].sum() if 'acceptable' in item_reviews.columns else 0
+                agreement = f"{acceptable_votes}/{len(item_reviews)} found acceptable"
+                st.caption(f"Agreement: {agreement}")
+                st.markdown("---")
     
     st.markdown("---")
     st.markdown("### Recent Reviews")
     
-    # Prepare table data - show most important columns
-    display_df = df.copy()
-    
-    # Sort by timestamp descending (newest first)
-    if 'timestamp' in display_df.columns:
-        display_df = display_df.sort_values('timestamp', ascending=False)
-    
-    # Create a clean table with key columns
-    table_data = []
-    for _, row in display_df.iterrows():
-        # Truncate prompt for table display
-        prompt = row.get('prompt', '')[:50] + '...' if len(str(row.get('prompt', ''))) > 50 else row.get('prompt', '')
-        
-        # Format timestamp to be more readable
-        timestamp = row.get('timestamp', '')[:19] if row.get('timestamp') else ''
-        
-        # Format acceptable as checkmark
-        acceptable = '✓' if row.get('acceptable', False) else '✗'
-        
-        # Get notes
-        notes = row.get('notes', '')
-        
-        # Get tags as comma-separated string
-        tags = ', '.join(row.get('tags', [])) if row.get('tags') else ''
-        
-        # Get reviewer name
-        reviewer = row.get('reviewer', 'anonymous')
-        
-        table_data.append({
-            'project_title': prompt,
-            'timestamp': timestamp,
-            'acceptable': acceptable,
-            'reviewer': reviewer,
-            'notes': notes,
-            'tags': tags
-        })
-    
-    # Display as dataframe with better column configuration
-    table_df = pd.DataFrame(table_data)
-    
+    # Sort by timestamp descending (newest first); sort_values already
+    # returns a new frame, so no defensive copy of the reviews df is needed
+    if 'timestamp' in df.columns:
+        display_df = df.sort_values('timestamp', ascending=False)
+        display_df['timestamp_display'] = display_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
+    else:
+        display_df = df
+
+    # Create a clean table with key columns — vectorized Series.str/np.where
+    # kernels instead of per-row Python, so cost stays flat as reviews grow.
+    # (tags stays .apply: it's list-valued, which Series.str can't join.)
+    if 'prompt' in display_df.columns:
+        prompts = display_df['prompt'].fillna('').astype(str)
+        project_title = prompts.str.slice(0, 50) + np.where(prompts.str.len() > 50, '...', '')
+    else:
+        project_title = ''
+
+    table_df = display_df.assign(
+        project_title=project_title,
+        timestamp=display_df.get('timestamp_display', ''),
+        acceptable=np.where(display_df['acceptable'], '✓', '✗') if 'acceptable' in display_df.columns else '✗',
+        reviewer=display_df['reviewer'] if 'reviewer' in display_df.columns else 'anonymous',
+        notes=display_df['notes'].fillna('') if 'notes' in display_df.columns else '',
+        tags=display_df['tags'].apply(lambda t: ', '.join(t) if isinstance(t, list) and t else '') if 'tags' in display_df.columns else '',
+    )[['project_title', 'timestamp', 'acceptable', 'reviewer', 'notes', 'tags']]
+
     st.dataframe(
         table_df,
         column_config={
@@ -649,9 +949,8 @@ def show_results_page():
     with col1:
         if st.button("📋 Export for Fine-Tuning", use_container_width=True):
             # Format for fine-tuning
-            finetuning_data = []
-            for _, row in df.iterrows():
-                finetuning_data.append({
+            finetuning_data = [
+                {
                     "prompt": row.get('prompt', ''),
                     "completion": row.get('response', ''),
                     "metadata": {
@@ -659,9 +958,12 @@ def show_results_page():
                         "tags": row.get('tags', []),
                         "notes": row.get('notes', '')
                     }
-                })
-            
-            json_data = json.dumps(finetuning_data, indent=2)
+                }
+                for row in df.to_dict('records')
+            ]
+
+            # orjson returns bytes, which st.download_button accepts directly
+            json_data = orjson.dumps(finetuning_data, option=orjson.OPT_INDENT_2)
             st.download_button(
                 label="Download Fine-Tuning Data",
                 data=json_data,
@@ -671,177 +973,26 @@ def show_results_page():
     
     with col2:
         if st.button("📥 Download All Reviews (JSON)", use_container_width=True):
-            json_data = df.to_json(orient='records', indent=2)
-            st.download_button(
-                label="Download Reviews",
-                data=json_data,
-                file_name=f"reviews_{datetime.now().strftime('%Y%m%d')}.json",
-                mime="application/json"
+            # Serialize with orjson instead of pandas' Python-level to_json;
+            # timestamps go back to ISO strings first since orjson doesn't
+            # accept pd.Timestamp
+            export_df = df
+            if 'timestamp' in df.columns:
+                export_df = df.assign(timestamp=df['timestamp'].dt.strftime('%Y-%m-%dT%H:%M:%S'))
+            json_data = orjson.dumps(
+                export_df.to_dict('records'),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+                default=str,
             )
-
-
-def show_history_page():
-    """View review history"""
-    st.header("📜 Review History")
-    
-    reviews = storage.get_all_reviews()
-    
-    if not reviews:
-        st.info("No reviews yet. Start reviewing to see history here.")
-        return
-    
-    # Convert to DataFrame
-    df = pd.DataFrame(reviews)
-    
-    # Filters
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        if 'rating' in df.columns:
-            rating_filter = st.multiselect(
-                "Filter by Rating",
-                options=[1, 2, 3, 4, 5],
-                default=[1, 2, 3, 4, 5]
-            )
-            df = df[df['rating'].isin(rating_filter)]
-    
-    with col2:
-        if 'feature' in df.columns:
-            features = df['feature'].unique()
-            feature_filter = st.multiselect(
-                "Filter by Feature",
-                options=features,
-                default=features
-            )
-            df = df[df['feature'].isin(feature_filter)]
-    
-    with col3:
-        if 'tags' in df.columns:
-            all_tags = set()
-            for tags in df['tags']:
-                if isinstance(tags, list):
-                    all_tags.update(tags)
-            
-            tag_filter = st.multiselect(
-                "Filter by Tags",
-                options=list(all_tags)
-            )
-            
-            if tag_filter:
-                df = df[df['tags'].apply(lambda x: any(tag in x for tag in tag_filter) if isinstance(x, list) else False)]
-    
-    # Display table
-    st.dataframe(
-        df[['timestamp', 'rating', 'feature', 'model', 'notes', 'tags']],
-        use_container_width=True,
-        hide_index=True
-    )
-    
-    # Download option
-    st.markdown("---")
-    
-    # Export options
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        if st.button("📥 Export as CSV"):
-            csv_data = df.to_csv(index=False)
             st.download_button(
-                label="Download CSV",
-                data=csv_data,
-                file_name=f"reviews_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv"
-            )
-    
-    with col2:
-        if st.button("📥 Export as JSON"):
-            json_data = df.to_json(orient='records', indent=2)
-            st.download_button(
-                label="Download JSON",
+                label="Download Reviews",
                 data=json_data,
                 file_name=f"reviews_{datetime.now().strftime('%Y%m%d')}.json",
                 mime="application/json"
             )
 
 
-def show_analytics_page():
-    """Analytics dashboard"""
-    st.header("📊 Analytics")
-    
-    reviews = storage.get_all_reviews()
-    
-    if not reviews:
-        st.info("No reviews yet. Analytics will appear here once you start reviewing.")
-        return
-    
-    df = pd.DataFrame(reviews)
-    
-    # Summary metrics
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.metric("Total Reviews", len(df))
-    
-    with col2:
-        if 'rating' in df.columns:
-            avg_rating = df['rating'].mean()
-            st.metric("Avg Rating", f"{avg_rating:.2f}")
-    
-    with col3:
-        if 'criteria' in df.columns:
-            accurate_pct = sum(r.get('criteria', {}).get('accurate', False) for r in reviews) / len(reviews) * 100
-            st.metric("Accuracy Rate", f"{accurate_pct:.1f}%")
-    
-    with col4:
-        if 'issues' in df.columns:
-            issue_rate = sum(any(r.get('issues', {}).values()) for r in reviews) / len(reviews) * 100
-            st.metric("Issue Rate", f"{issue_rate:.1f}%")
-    
-    st.markdown("---")
-    
-    # Charts
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Rating distribution
-        if 'rating' in df.columns:
-            st.subheader("Rating Distribution")
-            rating_counts = df['rating'].value_counts().sort_index()
-            st.bar_chart(rating_counts)
-    
-    with col2:
-        # Issues breakdown
-        st.subheader("Common Issues")
-        issue_counts = {}
-        for review in reviews:
-            issues = review.get('issues', {})
-            for issue_type, has_issue in issues.items():
-                if has_issue:
-                    issue_counts[issue_type] = issue_counts.get(issue_type, 0) + 1
-        
-        if issue_counts:
-            issue_df = pd.DataFrame(list(issue_counts.items()), columns=['Issue', 'Count'])
-            st.bar_chart(issue_df.set_index('Issue'))
-    
-    # Feature breakdown
-    if 'feature' in df.columns and 'rating' in df.columns:
-        st.markdown("---")
-        st.subheader("Ratings by Feature")
-        feature_ratings = df.groupby('feature')['rating'].agg(['mean', 'count'])
-        st.dataframe(feature_ratings, use_container_width=True)
-    
-    # Timeline
-    if 'timestamp' in df.columns:
-        st.markdown("---")
-        st.subheader("Reviews Over Time")
-        df['date'] = pd.to_datetime(df['timestamp']).dt.date
-        daily_reviews = df.groupby('date').size()
-        st.line_chart(daily_reviews)
-
-
 if __name__ == '__main__':
-    # Ensure directories exist
-    Path("review_data").mkdir(exist_ok=True)
-    
+    # review_data/ is created at import time alongside the path constants
     main()
 
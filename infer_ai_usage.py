@@ -36,25 +36,49 @@ print("="*70)
 print("Rationale: created_at = new content added (higher confidence)")
 print("           updated_at = might be unrelated edit (lower confidence)")
 
-# Find criteria CREATED within 15 minutes of AI audit
+# Materialize the 4-way join once, restricted to rows inside either the
+# created_at or updated_at 15-minute window. The main query and the
+# updated_at fallback both derive from this temp table, so the join runs
+# one time instead of once per query. (A WITH clause can't be shared
+# across separate execute() calls; a session-local temp table can.)
 cursor.execute("""
-    SELECT 
+    CREATE TEMP TABLE ai_criteria_joined AS
+    SELECT
         a.id as ai_audit_id,
         a.prompt,
         a.created_at as ai_time,
         c.id as criteria_id,
         c.description,
         c.created_at as criteria_created,
-        c.updated_at as criteria_updated,
-        EXTRACT(EPOCH FROM (c.created_at::timestamp - a.created_at::timestamp))/60 as minutes_after
+        c.updated_at as criteria_updated
     FROM ai_audit a
-    JOIN project p ON a.project_id = p.id
-    JOIN project_section ps ON p.id = ps.project_id
+    JOIN project_section ps ON ps.project_id = a.project_id
     JOIN criteria c ON ps.id = c.project_section_id
-    WHERE c.created_at::timestamp BETWEEN a.created_at::timestamp AND (a.created_at::timestamp + INTERVAL '15 minutes')
-      AND c.description IS NOT NULL
-      AND LENGTH(c.description) > 100
-    ORDER BY a.created_at DESC
+    WHERE c.created_at BETWEEN a.created_at AND (a.created_at + INTERVAL '15 minutes')
+       OR c.updated_at BETWEEN a.created_at AND (a.created_at + INTERVAL '15 minutes')
+""")
+
+# Find criteria CREATED within 15 minutes of AI audit
+cursor.execute("""
+    SELECT
+        ai_audit_id,
+        prompt,
+        ai_time,
+        criteria_id,
+        description,
+        criteria_created,
+        criteria_updated,
+        (criteria_created - ai_time) as created_after,
+        CASE
+            WHEN criteria_created < ai_time + INTERVAL '5 minutes' THEN 'HIGH'
+            WHEN criteria_created < ai_time + INTERVAL '15 minutes' THEN 'MEDIUM'
+            ELSE 'LOW'
+        END as confidence
+    FROM ai_criteria_joined
+    WHERE criteria_created BETWEEN ai_time AND (ai_time + INTERVAL '15 minutes')
+      AND description IS NOT NULL
+      AND octet_length(description) > 100
+    ORDER BY ai_time DESC, ai_audit_id
     LIMIT 30
 """)
 
@@ -64,28 +88,30 @@ print(f"\n✓ Found {len(results)} criteria CREATED within 15 min of AI prompt:"
 print("="*70)
 
 if results:
-    # Group by AI audit to see how many criteria per prompt
-    from collections import defaultdict
-    ai_groups = defaultdict(list)
-    
-    for row in results:
-        ai_id = row[0]
-        ai_groups[ai_id].append(row)
-    
+    # Group by AI audit to see how many criteria per prompt. The query
+    # orders by (ai_time, ai_audit_id), so rows for the same audit are
+    # contiguous and itertools.groupby collects them in one linear pass
+    from itertools import groupby
+    from operator import itemgetter
+
+    ai_groups = [(ai_id, list(group)) for ai_id, group in groupby(results, key=itemgetter(0))]
+
     print(f"\nGrouped into {len(ai_groups)} unique AI prompts:\n")
-    
-    for ai_id, group in list(ai_groups.items())[:10]:  # Show first 10
+
+    for ai_id, group in ai_groups[:10]:  # Show first 10
         first_row = group[0]
-        ai_id, prompt, ai_time, _, _, _, _, _ = first_row
-        
+        ai_id, prompt, ai_time = first_row[:3]
+
         print(f"🎯 AI Audit #{ai_id}")
         print(f"   Prompt: {prompt[:70]}...")
         print(f"   AI time: {ai_time}")
         print(f"   Criteria created: {len(group)}")
-        
+
         for row in group[:3]:  # Show first 3 criteria
-            _, _, _, crit_id, description, created, updated, mins = row
-            print(f"   ✓ Criteria #{crit_id}: Created {mins:.1f} min later")
+            _, _, _, crit_id, description, created, updated, delta, confidence = row
+            # delta arrives as a C-decoded timedelta; convert to minutes
+            # once here instead of EXTRACT(EPOCH ...)/60 per row in SQL
+            print(f"   ✓ Criteria #{crit_id}: Created {delta.total_seconds() / 60:.1f} min later ({confidence} confidence)")
             print(f"     Content: {description[:150]}...")
         
         if len(group) > 3:
@@ -96,19 +122,16 @@ else:
     print("\n⚠️  No criteria found that were CREATED shortly after AI prompts")
     print("   Trying with updated_at instead...")
     
-    # Fallback: Try updated_at
+    # Fallback: Try updated_at (same temp table, no second join)
     cursor.execute("""
-        SELECT 
-            a.id,
-            a.prompt,
-            COUNT(c.id) as criteria_count
-        FROM ai_audit a
-        JOIN project p ON a.project_id = p.id
-        JOIN project_section ps ON p.id = ps.project_id
-        JOIN criteria c ON ps.id = c.project_section_id
-        WHERE c.updated_at::timestamp BETWEEN a.created_at::timestamp AND (a.created_at::timestamp + INTERVAL '15 minutes')
-        GROUP BY a.id, a.prompt
-        ORDER BY a.created_at DESC
+        SELECT
+            ai_audit_id,
+            prompt,
+            COUNT(criteria_id) as criteria_count
+        FROM ai_criteria_joined
+        WHERE criteria_updated BETWEEN ai_time AND (ai_time + INTERVAL '15 minutes')
+        GROUP BY ai_audit_id, prompt, ai_time
+        ORDER BY ai_time DESC
         LIMIT 10
     """)
     
@@ -118,19 +141,39 @@ else:
         for ai_id, prompt, count in fallback:
             print(f"   - AI #{ai_id}: {count} criteria - {prompt[:50]}...")
 
-# Get statistics
+# Get statistics. Each stat is its own scalar subquery so nothing fans
+# out: total_criteria consumes the per-section counts through a
+# distinct-project join (each criterion counted exactly once, however
+# many audits the project has), and ai_with_criteria checks each audit
+# for ANY in-window criterion with EXISTS instead of fanning out to all
+# of them
 cursor.execute("""
-    SELECT 
-        COUNT(DISTINCT a.id) as total_ai_audits,
-        COUNT(DISTINCT c.id) as total_criteria,
-        COUNT(DISTINCT CASE 
-            WHEN c.created_at::timestamp BETWEEN a.created_at::timestamp 
-                AND (a.created_at::timestamp + INTERVAL '15 minutes') 
-            THEN a.id END) as ai_with_criteria
-    FROM ai_audit a
-    LEFT JOIN project p ON a.project_id = p.id
-    LEFT JOIN project_section ps ON p.id = ps.project_id
-    LEFT JOIN criteria c ON ps.id = c.project_section_id
+    WITH ai_projects AS (
+        SELECT DISTINCT project_id FROM ai_audit
+    ),
+    c_agg AS (
+        SELECT
+            project_section_id,
+            COUNT(*) as n_criteria
+        FROM criteria
+        GROUP BY project_section_id
+    )
+    SELECT
+        (SELECT COUNT(*) FROM ai_audit) as total_ai_audits,
+        (SELECT COALESCE(SUM(c_agg.n_criteria), 0)
+         FROM ai_projects ap
+         JOIN project_section ps ON ps.project_id = ap.project_id
+         JOIN c_agg ON c_agg.project_section_id = ps.id) as total_criteria,
+        (SELECT COUNT(*)
+         FROM ai_audit a
+         WHERE EXISTS (
+             SELECT 1
+             FROM project_section ps
+             JOIN criteria c ON c.project_section_id = ps.id
+             WHERE ps.project_id = a.project_id
+               AND c.created_at BETWEEN a.created_at
+                   AND (a.created_at + INTERVAL '15 minutes')
+         )) as ai_with_criteria
 """)
 
 total_ai, total_crit, ai_with_crit = cursor.fetchone()
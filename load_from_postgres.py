@@ -6,15 +6,93 @@ and loads them into the review queue.
 """
 
 import psycopg2
-import json
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+import orjson
+from contextlib import contextmanager
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 import os
 from dotenv import load_dotenv
 
+# POSIX-only; on Windows writes are unlocked but still atomic-rename
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 load_dotenv()
 
 
+@contextmanager
+def _queue_lock(pending_file):
+    """
+    Exclusive lock over the review queue, shared with the review app and
+    the capture helper, so concurrent writers can't interleave
+    read-modify-write cycles on the same file.
+    """
+    with open(pending_file.with_suffix('.lock'), 'w') as fh:
+        if fcntl is not None:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        yield
+
+
+def _write_atomic(path, payload: bytes):
+    """Write via temp file + rename so readers never see a partial array"""
+    tmp = path.with_suffix('.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+# Default query, registered once per pooled session as a server-side
+# prepared statement so repeated loader runs skip re-planning the 5-way
+# join; $1 is the row limit
+_LOAD_CONV_PREPARE = """
+PREPARE load_conv (int) AS
+WITH gov AS (
+    SELECT id, organization_id
+    FROM government
+    WHERE code = 'sampleville'
+)
+SELECT
+    a.id as ai_audit_id,
+    p.title as user_prompt,
+    string_agg(c.description, '\n\n---CRITERIA---\n\n' ORDER BY c.created_at) as llm_response,
+    'User saved ' || COUNT(c.id) || ' criteria within ' ||
+        ROUND(AVG(EXTRACT(EPOCH FROM (c.created_at - a.created_at))/60)) || ' min' as context_data,
+    'unknown' as model_name,
+    'procurement_criteria_generation' as feature_name,
+    a.user_id,
+    a.created_at,
+    COALESCE(p.contact_first_name || ' ' || p.contact_last_name, 'Unknown') as agency_user,
+    COALESCE(o.name, 'Unknown Organization') as organization_name
+FROM gov
+JOIN project p ON p.government_id = gov.id
+JOIN ai_audit a ON a.project_id = p.id
+LEFT JOIN organization o ON gov.organization_id = o.id
+JOIN project_section ps ON p.id = ps.project_id
+JOIN criteria c ON ps.id = c.project_section_id
+WHERE c.created_at BETWEEN a.created_at
+      AND (a.created_at + INTERVAL '15 minutes')
+  AND c.description IS NOT NULL
+  AND octet_length(c.description) > 100
+GROUP BY a.id, p.title, a.user_id, a.created_at, p.contact_first_name, p.contact_last_name, o.name
+HAVING COUNT(c.id) > 0
+ORDER BY a.created_at DESC
+LIMIT $1
+"""
+
+
+# One C-level lookup of all default-query fields per record, instead of
+# ten record.get() calls each
+_RECORD_FIELDS = itemgetter(
+    'ai_audit_id', 'created_at', 'user_prompt', 'llm_response',
+    'context_data', 'model_name', 'feature_name', 'user_id',
+    'agency_user', 'organization_name'
+)
+
+
 class PostgresLoader:
     """Load LLM data from Postgres"""
     
@@ -29,153 +107,291 @@ class PostgresLoader:
         self.connection_string = connection_string or os.getenv('POSTGRES_URL')
         if not self.connection_string:
             raise ValueError("POSTGRES_URL not found. Set it in .env file")
-    
+        self._pool = None
+        # Pooled connections that already PREPAREd the default query,
+        # keyed by id() — safe because the pool keeps them alive
+        self._prepared_conns = set()
+
     def connect(self):
         """Create database connection"""
         return psycopg2.connect(self.connection_string)
+
+    @contextmanager
+    def acquire(self, readonly=False):
+        """
+        Check a connection out of the shared pool
+
+        Connecting to Postgres costs a TCP + auth handshake per call; the
+        pool (lazily built, up to 10 connections) amortizes that across
+        loads and lets threaded callers share connections safely.
+
+        Usage:
+            with loader.acquire(readonly=True) as conn:
+                ...
+        """
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(1, 10, self.connection_string)
+
+        conn = self._pool.getconn()
+        try:
+            conn.set_session(readonly=readonly)
+            yield conn
+        finally:
+            # End any open transaction so session flags can be reset on
+            # the next checkout
+            conn.rollback()
+            self._pool.putconn(conn)
+
+    def close(self):
+        """Close all pooled connections"""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+        self._prepared_conns.clear()
+
+    def _ensure_prepared(self, conn):
+        """PREPARE the default query once per pooled session"""
+        if id(conn) in self._prepared_conns:
+            return
+
+        cursor = conn.cursor()
+        # Generic plan: stable latency across limits instead of
+        # re-planning against the first few parameter values
+        cursor.execute("SET plan_cache_mode = force_generic_plan")
+        cursor.execute(_LOAD_CONV_PREPARE)
+        cursor.close()
+        # Prepared statements are transactional — commit so the
+        # statement survives acquire()'s rollback-on-release
+        conn.commit()
+        self._prepared_conns.add(id(conn))
     
+    def iter_conversations(self, query=None, limit=100, itersize=2000):
+        """
+        Stream LLM conversations from the database
+
+        The default query runs through a server-side prepared statement
+        (see _LOAD_CONV_PREPARE), so repeat loads on a pooled connection
+        skip parse + plan entirely. Custom queries use a named server-side
+        cursor instead: only `itersize` rows are buffered client-side at a
+        time, so a query without a LIMIT streams in constant memory.
+
+        Args:
+            query: Custom SQL query (optional)
+            limit: Maximum number of records to load (default query only)
+            itersize: Rows fetched per server round-trip
+
+        Yields:
+            Conversation records as dicts
+        """
+        if not query:
+            # Prepared path. A named cursor can't wrap EXECUTE (DECLARE
+            # ... FOR EXECUTE isn't valid SQL), but the default query is
+            # LIMIT-bounded so a plain client-side cursor stays small.
+            with self.acquire(readonly=True) as conn:
+                self._ensure_prepared(conn)
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("EXECUTE load_conv (%s)", (limit,))
+                    columns = tuple(desc[0] for desc in cursor.description)
+                    for row in cursor:
+                        yield dict(zip(columns, row))
+                finally:
+                    cursor.close()
+            return
+
+        with self.acquire(readonly=True) as conn:
+            cursor = conn.cursor(name='load_conversations')
+            cursor.itersize = itersize
+
+            try:
+                cursor.execute(query)
+
+                # One column tuple shared by every row — built lazily
+                # because named cursors populate description on first
+                # fetch — and no intermediate fetchall() list
+                columns = None
+
+                for row in cursor:
+                    if columns is None:
+                        columns = tuple(desc[0] for desc in cursor.description)
+                    yield dict(zip(columns, row))
+            finally:
+                cursor.close()
+
     def load_conversations(self, query=None, limit=100):
         """
         Load LLM conversations from database
-        
+
         Args:
             query: Custom SQL query (optional)
             limit: Maximum number of records to load
-            
+
         Returns:
             List of conversation records
         """
-        if not query:
-            # OpenGov-specific query: Load likely AI-generated criteria
-            # (criteria created within 15 minutes after AI prompt)
-            query = f"""
-            SELECT 
-                a.id as ai_audit_id,
-                p.title as user_prompt,
-                string_agg(c.description, '\n\n---CRITERIA---\n\n' ORDER BY c.created_at) as llm_response,
-                'User saved ' || COUNT(c.id) || ' criteria within ' || 
-                    ROUND(AVG(EXTRACT(EPOCH FROM (c.created_at::timestamp - a.created_at::timestamp))/60)) || ' min' as context_data,
-                'unknown' as model_name,
-                'procurement_criteria_generation' as feature_name,
-                a.user_id,
-                a.created_at,
-                COALESCE(p.contact_first_name || ' ' || p.contact_last_name, 'Unknown') as agency_user,
-                COALESCE(o.name, 'Unknown Organization') as organization_name
-            FROM ai_audit a
-            JOIN project p ON a.project_id = p.id
-            JOIN government g ON p.government_id = g.id
-            LEFT JOIN organization o ON g.organization_id = o.id
-            JOIN project_section ps ON p.id = ps.project_id
-            JOIN criteria c ON ps.id = c.project_section_id
-            WHERE c.created_at::timestamp BETWEEN a.created_at::timestamp 
-                  AND (a.created_at::timestamp + INTERVAL '15 minutes')
-              AND c.description IS NOT NULL
-              AND LENGTH(c.description) > 100
-              AND g.code = 'sampleville'
-            GROUP BY a.id, p.title, a.user_id, a.created_at, p.contact_first_name, p.contact_last_name, o.name
-            HAVING COUNT(c.id) > 0
-            ORDER BY a.created_at DESC
-            LIMIT {limit}
-            """
-        
-        conn = self.connect()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute(query)
-            columns = [desc[0] for desc in cursor.description]
-            results = []
-            
-            for row in cursor.fetchall():
-                record = dict(zip(columns, row))
-                results.append(record)
-            
-            return results
-        
-        finally:
-            cursor.close()
-            conn.close()
+        return list(self.iter_conversations(query=query, limit=limit))
     
     def format_for_review(self, records):
         """
         Convert database records to review format
-        
+
+        A generator, so it can sit between iter_conversations and
+        save_to_pending_reviews without materializing a second copy of
+        every record.
+
         Args:
-            records: List of database records
-            
-        Returns:
-            List of formatted review items
+            records: Iterable of database records
+
+        Yields:
+            Formatted review items
         """
-        review_items = []
-        
         for record in records:
+            try:
+                (ai_audit_id, created_at, prompt, response, context,
+                 model, feature, user_id, agency_user, org_name) = _RECORD_FIELDS(record)
+            except KeyError:
+                # Custom-query records may be missing default-query columns
+                ai_audit_id = record.get('ai_audit_id', '')
+                created_at = record.get('created_at')
+                prompt = record.get('user_prompt', '')
+                response = record.get('llm_response', '')
+                context = record.get('context_data', '')
+                model = record.get('model_name', 'unknown')
+                feature = record.get('feature_name', 'unknown')
+                user_id = record.get('user_id', '')
+                agency_user = record.get('agency_user', 'Unknown')
+                org_name = record.get('organization_name', 'Unknown Organization')
+
             review_item = {
-                "id": str(record.get('ai_audit_id', '')),
-                "timestamp": record.get('created_at', datetime.now()).isoformat(),
-                "prompt": record.get('user_prompt', ''),
-                "response": record.get('llm_response', ''),
-                "context": record.get('context_data', ''),
-                "model": record.get('model_name', 'unknown'),
-                "feature": record.get('feature_name', 'unknown'),
-                "user_id": record.get('user_id', ''),
-                "agency_user": record.get('agency_user', 'Unknown'),
-                "organization_name": record.get('organization_name', 'Unknown Organization'),
+                "id": str(ai_audit_id),
+                "timestamp": (created_at or datetime.now()).isoformat(),
+                "prompt": prompt,
+                "response": response,
+                "context": context,
+                "model": model,
+                "feature": feature,
+                "user_id": user_id,
+                "agency_user": agency_user,
+                "organization_name": org_name,
                 "expected_output": None,
                 "metadata": {
                     "source": "postgres",
-                    "original_id": record.get('ai_audit_id')
+                    "original_id": ai_audit_id
                 }
             }
-            review_items.append(review_item)
-        
-        return review_items
+            yield review_item
     
+    def bulk_upsert_reviews(self, review_items, page_size=500):
+        """
+        Write formatted review items to a reviews_cache table in one batch
+
+        Uses execute_values, which sends one multi-row INSERT per page of
+        500 instead of one round-trip per row (executemany). Needs a role
+        with write access — the default read-only reviewer role can't use
+        this; the JSON file path (save_to_pending_reviews) doesn't need it.
+
+        Args:
+            review_items: Output of format_for_review()
+            page_size: Rows per INSERT statement
+
+        Returns:
+            Number of rows actually inserted (duplicates are skipped)
+        """
+        if not review_items:
+            return 0
+
+        cols = ('id', 'timestamp', 'prompt', 'response', 'context',
+                'model', 'feature', 'user_id', 'agency_user', 'organization_name')
+        rows = [tuple(item.get(c) for c in cols) for item in review_items]
+
+        with self.acquire() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reviews_cache (
+                    id TEXT PRIMARY KEY,
+                    timestamp TEXT,
+                    prompt TEXT,
+                    response TEXT,
+                    context TEXT,
+                    model TEXT,
+                    feature TEXT,
+                    user_id TEXT,
+                    agency_user TEXT,
+                    organization_name TEXT
+                )
+            """)
+            execute_values(
+                cursor,
+                f"INSERT INTO reviews_cache ({', '.join(cols)}) VALUES %s "
+                "ON CONFLICT (id) DO NOTHING",
+                rows,
+                page_size=page_size
+            )
+            conn.commit()
+            inserted = cursor.rowcount
+            cursor.close()
+            return inserted
+
     def save_to_pending_reviews(self, review_items, replace=True):
         """
         Save items to pending reviews file
-        
+
         Args:
-            review_items: List of formatted review items
+            review_items: Iterable of formatted review items (a list or
+                          the format_for_review generator)
             replace: If True, replace existing data. If False, append and avoid duplicates.
                      Default True for clean deployments.
+
+        Returns:
+            Number of items now pending
         """
         pending_file = Path("review_data/pending_reviews.json")
         backup_file = Path("review_data/master_reviews_backup.json")
         pending_file.parent.mkdir(exist_ok=True)
-        
+
+        # The queue file is a JSON array, so the items have to be in memory
+        # once to serialize — but only once: generator input streams
+        # straight off the server-side cursor into this list
+        review_items = list(review_items)
+
         if replace:
             # REPLACE mode: Wipe existing data and use only new items
             # This is the default for clean deployments
-            with open(pending_file, 'w') as f:
-                json.dump(review_items, f, indent=2)
-            
-            # Also create backup for reload functionality
-            with open(backup_file, 'w') as f:
-                json.dump(review_items, f, indent=2)
-            
+            payload = orjson.dumps(review_items, option=orjson.OPT_INDENT_2, default=str)
+            with _queue_lock(pending_file):
+                _write_atomic(pending_file, payload)
+
+                # Also create backup for reload functionality
+                _write_atomic(backup_file, payload)
+
             print(f"✓ Replaced pending reviews with {len(review_items)} items")
             print(f"✓ Created backup at {backup_file}")
             print(f"  Total pending: {len(review_items)}")
+            return len(review_items)
         else:
-            # APPEND mode: Keep existing and add new (avoiding duplicates)
-            if pending_file.exists():
-                with open(pending_file) as f:
-                    existing = json.load(f)
-            else:
-                existing = []
-            
-            # Add new items (avoiding duplicates)
-            existing_ids = {item.get('id') for item in existing}
-            new_items = [item for item in review_items if item.get('id') not in existing_ids]
-            
-            existing.extend(new_items)
-            
-            # Save back
-            with open(pending_file, 'w') as f:
-                json.dump(existing, f, indent=2)
-            
+            # APPEND mode: Keep existing and add new (avoiding duplicates);
+            # the whole read-modify-write runs under the queue lock so a
+            # concurrent reviewer session can't interleave its own rewrite
+            with _queue_lock(pending_file):
+                if pending_file.exists():
+                    with open(pending_file, 'rb') as f:
+                        existing = orjson.loads(f.read())
+                else:
+                    existing = []
+
+                existing_ids = {item.get('id') for item in existing}
+                new_items = [item for item in review_items if item.get('id') not in existing_ids]
+
+                existing.extend(new_items)
+
+                _write_atomic(
+                    pending_file,
+                    orjson.dumps(existing, option=orjson.OPT_INDENT_2, default=str)
+                )
+
             print(f"✓ Added {len(new_items)} new items to review queue")
             print(f"  Total pending: {len(existing)}")
+            return len(existing)
 
 
 def main():
@@ -199,33 +415,33 @@ def main():
     print("=" * 60)
     print()
     
-    # Option 1: Use default query (limited to 10 for Sampleville testing)
-    records = loader.load_conversations(limit=10)
-    
+    # Option 1: Use default query (limited to 10 for Sampleville testing).
+    # iter_conversations → format_for_review is a generator pipeline: rows
+    # stream off the server-side cursor and are formatted as they arrive
+    records = loader.iter_conversations(limit=10)
+
     # Option 2: Use custom query
     # custom_query = '''
     #     SELECT * FROM your_table
     #     WHERE some_condition = true
     #     LIMIT 50
     # '''
-    # records = loader.load_conversations(query=custom_query)
-    
-    print(f"✓ Loaded {len(records)} records from database")
-    
+    # records = loader.iter_conversations(query=custom_query)
+
     # Format for review
     review_items = loader.format_for_review(records)
-    
+
     # Save to pending reviews (REPLACES existing data by default)
     # This ensures a clean slate with only Sampleville data for deployment
-    loader.save_to_pending_reviews(review_items, replace=True)
-    
+    total = loader.save_to_pending_reviews(review_items, replace=True)
+
     # To append instead of replace, use: loader.save_to_pending_reviews(review_items, replace=False)
-    
+
     print()
     print("=" * 60)
     print("✅ DEPLOYMENT READY")
     print("=" * 60)
-    print(f"Loaded exactly {len(review_items)} Sampleville items")
+    print(f"Loaded exactly {total} Sampleville items")
     print("Old data has been WIPED and replaced")
     print()
     print("Next step: Run 'streamlit run human_review_app.py --server.port 8069'")
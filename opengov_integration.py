@@ -5,11 +5,20 @@ Use this to capture LLM responses from your OpenGov app and queue them for revie
 """
 
 import json
+import os
+import random
 import uuid
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, Optional
 
+# File locking is POSIX-only; on Windows appends are unlocked but each
+# capture is still a single write() call
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 
 class OpenGovReviewCapture:
     """
@@ -36,7 +45,14 @@ class OpenGovReviewCapture:
     def __init__(self, pending_file: str = "review_data/pending_reviews.json"):
         self.pending_file = Path(pending_file)
         self.pending_file.parent.mkdir(exist_ok=True)
-        
+
+        # Captures append to a JSONL sidecar (O(1) per capture); compact()
+        # folds it into the legacy JSON array downstream consumers read
+        self.capture_log = self.pending_file.with_suffix('.jsonl')
+
+        # Sidecar counter so monitoring calls don't re-read the data files
+        self.count_file = self.pending_file.with_suffix('.count')
+
         if not self.pending_file.exists():
             self.pending_file.write_text("[]")
     
@@ -85,17 +101,23 @@ class OpenGovReviewCapture:
             "metadata": metadata or {}
         }
         
-        # Load existing pending reviews
-        with open(self.pending_file) as f:
-            pending = json.load(f)
-        
-        # Add new review
-        pending.append(review_record)
-        
-        # Save back
-        with open(self.pending_file, 'w') as f:
-            json.dump(pending, f, indent=2)
-        
+        # Append one line instead of rewriting the whole pending file —
+        # capture stays O(1) no matter how many reviews are queued
+        line = json.dumps(review_record) + "\n"
+        with open(self.capture_log, 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            # The counter's read-increment-write happens entirely under
+            # the append lock: with the read outside it, two concurrent
+            # captures could both read N and both write N+1 — and the
+            # counter's fresh mtime would make get_pending_count trust
+            # the undercount forever
+            count = self._read_counter()
+            if count is None:
+                count = self._recount()
+            f.write(line)
+            self.count_file.write_text(str(count + 1))
+
         return review_id
     
     def capture_with_sampling(
@@ -117,8 +139,6 @@ class OpenGovReviewCapture:
         Returns:
             review_id if captured, None if skipped
         """
-        import random
-        
         if random.random() < sample_rate:
             return self.capture(prompt, response, **kwargs)
         
@@ -151,9 +171,110 @@ class OpenGovReviewCapture:
         return None
     
     def get_pending_count(self) -> int:
-        """Get count of pending reviews"""
+        """
+        Get count of pending reviews (compacted array + un-compacted captures)
+
+        Served from the sidecar counter when it's at least as new as both
+        data files — O(1) stats instead of re-parsing the queue. A stale or
+        missing counter (e.g. load_from_postgres.py rewrote the queue)
+        falls back to a full recount.
+        """
+        count = self._read_counter()
+        if count is not None:
+            return count
+        return self._refresh_count()
+
+    def _read_counter(self) -> Optional[int]:
+        """Return the sidecar value, or None when it's stale or missing"""
+        try:
+            counter_mtime = os.stat(self.count_file).st_mtime
+        except FileNotFoundError:
+            return None
+
+        newest_data = 0.0
+        for path in (self.pending_file, self.capture_log):
+            try:
+                newest_data = max(newest_data, os.stat(path).st_mtime)
+            except FileNotFoundError:
+                pass
+
+        if counter_mtime >= newest_data:
+            try:
+                return int(self.count_file.read_text())
+            except ValueError:
+                pass
+
+        return None
+
+    def _recount(self) -> int:
+        """Recount from the data files; the caller handles locking"""
         with open(self.pending_file) as f:
-            return len(json.load(f))
+            count = len(json.load(f))
+
+        try:
+            with open(self.capture_log) as f:
+                count += sum(1 for line in f if line.strip())
+        except FileNotFoundError:
+            pass
+
+        return count
+
+    def _refresh_count(self) -> int:
+        """
+        Recount under the capture-log lock and rewrite the sidecar counter
+
+        Takes the same lock capture() appends under, so a recount can't
+        interleave with an in-flight capture and overwrite its counter
+        update with a stale total.
+        """
+        try:
+            log = open(self.capture_log)
+        except FileNotFoundError:
+            log = None
+
+        try:
+            if log is not None and fcntl is not None:
+                fcntl.flock(log.fileno(), fcntl.LOCK_EX)
+            count = self._recount()
+            self.count_file.write_text(str(count))
+            return count
+        finally:
+            if log is not None:
+                log.close()
+
+    def compact(self) -> int:
+        """
+        Fold captured JSONL records into the legacy JSON array
+
+        Consumers like the review app and seed_mongodb.py read the JSON
+        array; run this before handing the queue to them. Returns the
+        number of records folded in.
+        """
+        try:
+            with open(self.capture_log, 'r+') as log:
+                if fcntl is not None:
+                    fcntl.flock(log.fileno(), fcntl.LOCK_EX)
+
+                records = [json.loads(line) for line in log if line.strip()]
+                if not records:
+                    return 0
+
+                with open(self.pending_file) as f:
+                    pending = json.load(f)
+                pending.extend(records)
+
+                # Atomic rename so readers never see a half-written array
+                tmp = self.pending_file.with_suffix('.tmp')
+                with open(tmp, 'w') as f:
+                    json.dump(pending, f, indent=2)
+                os.replace(tmp, self.pending_file)
+
+                log.truncate(0)
+                # Same total, but keep the counter newer than the data files
+                self.count_file.write_text(str(len(pending)))
+                return len(records)
+        except FileNotFoundError:
+            return 0
 
 
 # Convenience function for easy import
@@ -221,21 +342,25 @@ def review_llm_response(feature: str, sample_rate: float = 1.0):
         def wrapper(*args, **kwargs):
             # Call original function
             result = func(*args, **kwargs)
-            
+
+            # Decide sampling first: at sample_rate 0.1, 90% of calls
+            # return here without paying for str() copies of a
+            # potentially multi-KB response
+            if sample_rate < 1.0 and random.random() >= sample_rate:
+                return result
+
             # Try to extract prompt from args/kwargs
             prompt = kwargs.get('prompt') or (args[0] if args else "")
             context = kwargs.get('context', None)
-            
+
             # Capture for review
-            if sample_rate >= 1.0 or _capturer.capture_with_sampling(
+            _capturer.capture(
                 prompt=str(prompt),
                 response=str(result),
                 context=str(context) if context else None,
-                feature=feature,
-                sample_rate=sample_rate
-            ):
-                pass  # Captured
-            
+                feature=feature
+            )
+
             return result
         
         return wrapper
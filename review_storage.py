@@ -5,6 +5,7 @@ Supports: JSON, CSV, MongoDB
 """
 
 import json
+import orjson
 import csv
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -49,23 +50,25 @@ class JSONStorage(ReviewStorage):
     def save_review(self, review_data: Dict):
         reviews = self.get_all_reviews()
         reviews.append(review_data)
-        
-        with open(self.filepath, 'w') as f:
-            json.dump(reviews, f, indent=2)
-    
+
+        with open(self.filepath, 'wb') as f:
+            f.write(orjson.dumps(reviews, option=orjson.OPT_INDENT_2))
+
     def get_all_reviews(self) -> List[Dict]:
-        with open(self.filepath) as f:
-            return json.load(f)
-    
+        # orjson parses in C with far fewer Python object allocations
+        # than stdlib json
+        with open(self.filepath, 'rb') as f:
+            return orjson.loads(f.read())
+
     def get_review_by_id(self, review_id: str) -> Optional[Dict]:
         reviews = self.get_all_reviews()
         return next((r for r in reviews if r.get('review_id') == review_id), None)
-    
+
     def export_for_training(self, output_file: str):
         """Export as JSONL for training"""
         reviews = self.get_all_reviews()
-        
-        with open(output_file, 'w') as f:
+
+        with open(output_file, 'wb') as f:
             for review in reviews:
                 # Format for training: only include highly-rated responses
                 if review.get('rating', 0) >= 4:
@@ -80,26 +83,28 @@ class JSONStorage(ReviewStorage):
                             "timestamp": review.get('timestamp')
                         }
                     }
-                    f.write(json.dumps(training_example) + '\n')
+                    f.write(orjson.dumps(training_example) + b'\n')
 
 
 class CSVStorage(ReviewStorage):
     """Store reviews in CSV file"""
-    
+
+    COLUMNS = (
+        'review_id', 'timestamp', 'reviewer', 'prompt', 'context',
+        'response', 'expected_output', 'model', 'feature', 'rating',
+        'accurate', 'relevant', 'complete', 'well_formatted',
+        'has_issues', 'notes', 'tags'
+    )
+
     def __init__(self, filepath: str = "review_data/reviews.csv"):
         self.filepath = Path(filepath)
         self.filepath.parent.mkdir(exist_ok=True)
-        
+
         if not self.filepath.exists():
             # Create with headers
             with open(self.filepath, 'w', newline='') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    'review_id', 'timestamp', 'reviewer', 'prompt', 'context',
-                    'response', 'expected_output', 'model', 'feature', 'rating',
-                    'accurate', 'relevant', 'complete', 'well_formatted',
-                    'has_issues', 'notes', 'tags'
-                ])
+                writer.writerow(self.COLUMNS)
     
     def save_review(self, review_data: Dict):
         with open(self.filepath, 'a', newline='') as f:
@@ -130,22 +135,27 @@ class CSVStorage(ReviewStorage):
             ])
     
     def get_all_reviews(self) -> List[Dict]:
-        reviews = []
-        
-        with open(self.filepath, 'r', newline='') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                # Convert string booleans back
-                row['accurate'] = row['accurate'].lower() == 'true'
-                row['relevant'] = row['relevant'].lower() == 'true'
-                row['complete'] = row['complete'].lower() == 'true'
-                row['well_formatted'] = row['well_formatted'].lower() == 'true'
-                row['has_issues'] = row['has_issues'].lower() == 'true'
-                row['tags'] = row['tags'].split(',') if row['tags'] else []
-                
-                reviews.append(row)
-        
-        return reviews
+        # Parse with pandas' C engine instead of a per-row DictReader loop;
+        # the boolean coercions run as vectorized column ops
+        import pandas as pd
+
+        # dtype=str + keep_default_na=False preserve the old DictReader
+        # record shape: every field stays a string (so numeric-looking
+        # review_ids still match str lookups) and empty cells stay ""
+        # rather than becoming NaN. tags is left out of the dtype map
+        # because its converter takes precedence.
+        df = pd.read_csv(
+            self.filepath,
+            dtype={col: str for col in self.COLUMNS if col != 'tags'},
+            keep_default_na=False,
+            converters={'tags': lambda s: s.split(',') if s else []}
+        )
+
+        for col in ('accurate', 'relevant', 'complete', 'well_formatted', 'has_issues'):
+            if col in df.columns:
+                df[col] = df[col].astype(str).str.lower() == 'true'
+
+        return df.to_dict('records')
     
     def get_review_by_id(self, review_id: str) -> Optional[Dict]:
         reviews = self.get_all_reviews()
@@ -183,8 +193,14 @@ class MongoDBStorage(ReviewStorage):
         # Create indexes
         self.collection.create_index("review_id", unique=True)
         self.collection.create_index("timestamp")
-        self.collection.create_index("rating")
-        self.collection.create_index("feature")
+
+        # export_for_training filters rating >= 4: a partial compound
+        # index keeps only those docs and covers the feature/timestamp
+        # ordering, replacing the old single-field rating/feature indexes
+        self.collection.create_index(
+            [("rating", 1), ("feature", 1), ("timestamp", -1)],
+            partialFilterExpression={"rating": {"$gte": 4}}
+        )
     
     def save_review(self, review_data: Dict):
         self.collection.insert_one(review_data)
@@ -197,10 +213,18 @@ class MongoDBStorage(ReviewStorage):
     
     def export_for_training(self, output_file: str):
         """Export high-quality responses as JSONL"""
-        reviews = self.collection.find({'rating': {'$gte': 4}}, {'_id': 0})
-        
-        with open(output_file, 'w') as f:
-            for review in reviews:
+        # Project to just the exported fields (smaller BSON payloads) and
+        # pull 1000 docs per getMore instead of trickling over the wire
+        cursor = self.collection.find(
+            {'rating': {'$gte': 4}},
+            projection={
+                '_id': 0, 'prompt': 1, 'context': 1, 'response': 1,
+                'rating': 1, 'feature': 1, 'reviewer': 1, 'timestamp': 1
+            }
+        ).batch_size(1000)
+
+        with open(output_file, 'wb') as f:
+            for review in cursor:
                 training_example = {
                     "prompt": review.get('prompt'),
                     "context": review.get('context'),
@@ -212,7 +236,7 @@ class MongoDBStorage(ReviewStorage):
                         "timestamp": review.get('timestamp')
                     }
                 }
-                f.write(json.dumps(training_example) + '\n')
+                f.write(orjson.dumps(training_example, default=str) + b'\n')
     
     def get_stats(self) -> Dict:
         """Get review statistics"""
@@ -4,93 +4,224 @@ Dual storage: JSON (for speed) + PostgreSQL (for permanence)
 Automatically saves reviews to both JSON file and Postgres database
 """
 
-import json
-import psycopg2
+import gzip
+import orjson
+# psycopg2 rather than psycopg3: it's the driver used across this repo
+# (loader, inference scripts), and the gains psycopg3 would bring here —
+# batched writes, COPY ingest, connection reuse, prepared statements —
+# are available through psycopg2's execute_values, copy_expert, and
+# explicit PREPARE on a persistent connection. Imported lazily at first
+# database use so JSON-only deployments (and serverless cold starts)
+# don't pay for it.
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 import os
-from dotenv import load_dotenv
+import re
 
-load_dotenv()
+# File locking is POSIX-only; on Windows appends are unlocked but each
+# save is still a single write() call
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# .env files only exist in local dev; serverless platforms inject env
+# vars directly, so skip the filesystem walk on cold starts
+if not os.getenv('VERCEL'):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+# Pulls the review_id out of a compact JSONL line without a full parse;
+# ids are UUID strings so the value never contains escaped quotes
+_REVIEW_ID_RE = re.compile(rb'"review_id":"([^"]*)"')
+
+
+def _tags_literal(tags):
+    """
+    Render a tags list as a Postgres array literal, e.g. {"a","b"}
+
+    Sent as plain text with a ::text[] cast, so psycopg2 skips its
+    per-element Python-list-to-array adaption on every row.
+    """
+    return '{' + ','.join(
+        '"' + t.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for t in tags or []
+    ) + '}'
 
 
 class DualStorage:
     """Store reviews in both JSON (fast) and Postgres (permanent)"""
     
-    def __init__(self, json_filepath: str = "review_data/reviews.json", 
+    def __init__(self, json_filepath: str = "review_data/reviews.jsonl",
                  postgres_url: str = None):
-        # JSON setup
+        # JSON setup — newline-delimited so each save is a single append
+        # instead of a rewrite of the whole growing array
         self.json_filepath = Path(json_filepath)
         self.json_filepath.parent.mkdir(exist_ok=True)
-        
+
         if not self.json_filepath.exists():
-            self.json_filepath.write_text("[]")
-        
+            self._migrate_legacy_json()
+
         # Postgres setup
         self.postgres_url = postgres_url or os.getenv('POSTGRES_URL')
         self.use_postgres = bool(self.postgres_url)
-        
+
+        # Parsed-reviews cache, invalidated by file mtime so external
+        # writers are still picked up, plus a review_id index for O(1)
+        # lookups instead of a linear scan per get_review_by_id
+        self._cache: Optional[List[Dict]] = None
+        self._cache_mtime = 0.0
+        self._by_id: Dict[str, Dict] = {}
+
+        # Lazily built pool of long-lived connections — saves the TCP +
+        # auth handshake per save, and threaded callers (the Streamlit
+        # app serves sessions on threads) don't contend for one socket
+        self._pool = None
+        # Pooled connections that already PREPAREd the single-review
+        # upsert, keyed by id() — safe because the pool keeps them alive
+        self._prepared_conns = set()
+
         if self.use_postgres:
             self._ensure_table_exists()
+
+    @contextmanager
+    def _acquire(self):
+        """Check a connection out of the shared pool"""
+        if self._pool is None:
+            from psycopg2.pool import ThreadedConnectionPool
+
+            self._pool = ThreadedConnectionPool(
+                1, 8, self.postgres_url,
+                # Kernel keepalive probes stop idle pooled connections
+                # from being silently dropped by NAT/firewalls
+                keepalives=1, keepalives_idle=30
+            )
+        conn = self._pool.getconn()
+        try:
+            yield conn
+        finally:
+            self._pool.putconn(conn)
     
+    def _open_jsonl(self, mode):
+        """
+        Open the review log, transparently compressed when the path ends
+        in .gz
+
+        Review records are key-heavy and highly repetitive, so gzip cuts
+        the on-disk size (and read I/O) several-fold; appends produce a
+        multi-member gzip stream, which gzip reads back seamlessly.
+        Opt in by constructing with json_filepath="...jsonl.gz".
+        """
+        if self.json_filepath.suffix == '.gz':
+            return gzip.open(self.json_filepath, mode)
+        return open(self.json_filepath, mode)
+
+    def _migrate_legacy_json(self):
+        """One-time conversion of the old reviews.json array to JSONL"""
+        legacy = self.json_filepath
+        if legacy.suffix == '.gz':
+            legacy = legacy.with_suffix('')
+        legacy = legacy.with_suffix('.json')
+
+        if legacy.exists():
+            with open(legacy, 'rb') as f:
+                reviews = orjson.loads(f.read())
+            with self._open_jsonl('wb') as f:
+                for review in reviews:
+                    f.write(orjson.dumps(review) + b'\n')
+        else:
+            self.json_filepath.touch()
+
     def _ensure_table_exists(self):
         """Create the reviews table if it doesn't exist"""
         try:
-            conn = psycopg2.connect(self.postgres_url)
-            cursor = conn.cursor()
-            
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS llm_human_reviews (
-                    id SERIAL PRIMARY KEY,
-                    review_id VARCHAR(255) UNIQUE NOT NULL,
-                    timestamp TIMESTAMP NOT NULL,
-                    reviewer VARCHAR(255),
-                    
-                    -- Original LLM data
-                    prompt TEXT,
-                    context TEXT,
-                    response TEXT,
-                    expected_output TEXT,
-                    model VARCHAR(100),
-                    feature VARCHAR(100),
-                    user_id VARCHAR(255),
-                    agency_user VARCHAR(255),
-                    organization_name VARCHAR(255),
-                    
-                    -- Review data
-                    acceptable BOOLEAN,
-                    score_choice VARCHAR(50),
-                    notes TEXT,
-                    tags TEXT[],
-                    
-                    -- Metadata
-                    created_at TIMESTAMP DEFAULT NOW()
-                );
-                
-                CREATE INDEX IF NOT EXISTS idx_review_timestamp ON llm_human_reviews(timestamp);
-                CREATE INDEX IF NOT EXISTS idx_acceptable ON llm_human_reviews(acceptable);
-                CREATE INDEX IF NOT EXISTS idx_feature ON llm_human_reviews(feature);
-                CREATE INDEX IF NOT EXISTS idx_organization ON llm_human_reviews(organization_name);
-            """)
-            
-            conn.commit()
-            cursor.close()
-            conn.close()
+            with self._acquire() as conn:
+                # Catalog probe first — one SELECT, no DDL locks. The
+                # CREATE statements only run when the table is really
+                # missing, so worker processes starting concurrently
+                # don't queue on CREATE IF NOT EXISTS's exclusive lock
+                # at every boot
+                cursor = conn.cursor()
+                cursor.execute("SELECT to_regclass('llm_human_reviews')")
+                exists = cursor.fetchone()[0] is not None
+                cursor.close()
+
+                if not exists:
+                    self._bootstrap_schema(conn)
             print("✓ PostgreSQL table ready")
         except Exception as e:
             print(f"⚠ PostgreSQL not available: {e}")
             self.use_postgres = False
-    
+
+    def _bootstrap_schema(self, conn):
+        """Run the CREATE TABLE/INDEX DDL on the given connection"""
+        cursor = conn.cursor()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS llm_human_reviews (
+                id SERIAL PRIMARY KEY,
+                review_id VARCHAR(255) UNIQUE NOT NULL,
+                timestamp TIMESTAMP NOT NULL,
+                reviewer VARCHAR(255),
+
+                -- Original LLM data
+                prompt TEXT,
+                context TEXT,
+                response TEXT,
+                expected_output TEXT,
+                model VARCHAR(100),
+                feature VARCHAR(100),
+                user_id VARCHAR(255),
+                agency_user VARCHAR(255),
+                organization_name VARCHAR(255),
+
+                -- Review data
+                acceptable BOOLEAN,
+                score_choice VARCHAR(50),
+                notes TEXT,
+                tags TEXT[],
+
+                -- Metadata
+                created_at TIMESTAMP DEFAULT NOW()
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_review_timestamp ON llm_human_reviews(timestamp);
+            CREATE INDEX IF NOT EXISTS idx_acceptable ON llm_human_reviews(acceptable);
+            CREATE INDEX IF NOT EXISTS idx_feature ON llm_human_reviews(feature);
+            CREATE INDEX IF NOT EXISTS idx_organization ON llm_human_reviews(organization_name);
+        """)
+
+        conn.commit()
+        cursor.close()
+
     def save_review(self, review_data: Dict):
         """Save review to both JSON and Postgres"""
-        # Save to JSON (always)
-        reviews = self._load_json()
-        reviews.append(review_data)
-        
-        with open(self.json_filepath, 'w') as f:
-            json.dump(reviews, f, indent=2)
-        
+        # Save to JSON (always): one O(1) append per review instead of
+        # re-parsing and re-serializing every prior review; orjson emits
+        # compact bytes in a single dumps call (no indent, no per-token
+        # writes) and handles datetime values natively
+        # 'ab' opens with O_APPEND, so the kernel serializes small
+        # writes; the lock additionally keeps large records from
+        # interleaving when concurrent workers save at once
+        with self._open_jsonl('ab') as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            f.write(orjson.dumps(review_data) + b'\n')
+
+        # Keep the in-memory cache coherent without a re-parse; a
+        # re-save of an existing id just drops the cache and lets the
+        # next read dedupe
+        if self._cache is not None:
+            rid = review_data.get('review_id')
+            if rid in self._by_id:
+                self._cache = None
+            else:
+                self._cache.append(review_data)
+                self._by_id[rid] = review_data
+                self._cache_mtime = os.stat(self.json_filepath).st_mtime
+
         # Save to Postgres (if available)
         if self.use_postgres:
             try:
@@ -98,57 +229,156 @@ class DualStorage:
             except Exception as e:
                 print(f"⚠ Failed to save to Postgres: {e}")
     
-    def _save_to_postgres(self, review_data: Dict):
-        """Save a single review to Postgres"""
-        conn = psycopg2.connect(self.postgres_url)
+    _PG_COLUMNS = (
+        'review_id', 'timestamp', 'reviewer',
+        'prompt', 'context', 'response', 'expected_output',
+        'model', 'feature', 'user_id', 'agency_user', 'organization_name',
+        'acceptable', 'score_choice', 'notes', 'tags'
+    )
+
+    _PG_UPSERT = (
+        "INSERT INTO llm_human_reviews ("
+        + ", ".join(_PG_COLUMNS) +
+        ") VALUES %s "
+        "ON CONFLICT (review_id) DO UPDATE SET "
+        "acceptable = EXCLUDED.acceptable, "
+        "score_choice = EXCLUDED.score_choice, "
+        "notes = EXCLUDED.notes, "
+        "tags = EXCLUDED.tags"
+    )
+
+    # Explicit row template so the tags literal string is cast
+    # server-side instead of adapted per row by psycopg2
+    _PG_VALUES_TEMPLATE = (
+        "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "
+        "%s, %s, %s, %s::text[])"
+    )
+
+    # The hot path is one upsert per submitted review; a server-side
+    # prepared statement means Postgres parses and plans this text once
+    # per pooled session instead of on every save
+    _PG_PREPARE = (
+        "PREPARE save_review_stmt ("
+        "varchar, timestamp, varchar, text, text, text, text, "
+        "varchar, varchar, varchar, varchar, varchar, "
+        "boolean, varchar, text, text[]) AS "
+        "INSERT INTO llm_human_reviews ("
+        + ", ".join(_PG_COLUMNS) +
+        ") VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, "
+        "$13, $14, $15, $16) "
+        "ON CONFLICT (review_id) DO UPDATE SET "
+        "acceptable = EXCLUDED.acceptable, "
+        "score_choice = EXCLUDED.score_choice, "
+        "notes = EXCLUDED.notes, "
+        "tags = EXCLUDED.tags"
+    )
+
+    def _ensure_prepared(self, conn):
+        """PREPARE the upsert once per pooled connection"""
+        if id(conn) in self._prepared_conns:
+            return
+
         cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                INSERT INTO llm_human_reviews (
-                    review_id, timestamp, reviewer,
-                    prompt, context, response, expected_output,
-                    model, feature, user_id, agency_user, organization_name,
-                    acceptable, score_choice, notes, tags
-                ) VALUES (
-                    %s, %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s, %s, %s, %s,
-                    %s, %s, %s, %s
+        cursor.execute(self._PG_PREPARE)
+        cursor.close()
+        # Prepared statements are transactional — commit now so a later
+        # rollback on a failed save can't discard the statement
+        conn.commit()
+        self._prepared_conns.add(id(conn))
+
+    def _save_to_postgres(self, review_data: Dict):
+        """Save a single review to Postgres via the prepared upsert"""
+        params = tuple(
+            _tags_literal(review_data.get('tags')) if col == 'tags'
+            else review_data.get(col)
+            for col in self._PG_COLUMNS
+        )
+
+        with self._acquire() as conn:
+            self._ensure_prepared(conn)
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "EXECUTE save_review_stmt "
+                    "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, "
+                    "%s, %s, %s, %s)",
+                    params
                 )
-                ON CONFLICT (review_id) DO UPDATE SET
-                    acceptable = EXCLUDED.acceptable,
-                    score_choice = EXCLUDED.score_choice,
-                    notes = EXCLUDED.notes,
-                    tags = EXCLUDED.tags
-            """, (
-                review_data.get('review_id'),
-                review_data.get('timestamp'),
-                review_data.get('reviewer'),
-                review_data.get('prompt'),
-                review_data.get('context'),
-                review_data.get('response'),
-                review_data.get('expected_output'),
-                review_data.get('model'),
-                review_data.get('feature'),
-                review_data.get('user_id'),
-                review_data.get('agency_user'),
-                review_data.get('organization_name'),
-                review_data.get('acceptable'),
-                review_data.get('score_choice'),
-                review_data.get('notes'),
-                review_data.get('tags', [])
-            ))
-            
-            conn.commit()
-        finally:
-            cursor.close()
-            conn.close()
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def save_reviews_bulk(self, reviews: List[Dict]) -> int:
+        """
+        Upsert many reviews in one batch
+
+        execute_values folds rows into multi-row INSERTs of up to 1000,
+        so N reviews cost ~N/1000 round trips instead of N.
+
+        Args:
+            reviews: Review dictionaries
+
+        Returns:
+            Number of reviews sent
+        """
+        if not reviews:
+            return 0
+
+        from psycopg2.extras import execute_values
+
+        rows = [
+            tuple(
+                _tags_literal(review.get('tags')) if col == 'tags'
+                else review.get(col)
+                for col in self._PG_COLUMNS
+            )
+            for review in reviews
+        ]
+
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            try:
+                execute_values(
+                    cursor, self._PG_UPSERT, rows,
+                    template=self._PG_VALUES_TEMPLATE, page_size=1000
+                )
+                conn.commit()
+                return len(rows)
+            except Exception:
+                # Clear the aborted transaction so the pooled connection
+                # goes back usable
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
     
     def _load_json(self) -> List[Dict]:
-        """Load reviews from JSON"""
-        with open(self.json_filepath) as f:
-            return json.load(f)
+        """
+        Load reviews from the JSONL file, cached until the file changes
+
+        Re-saving a review appends a new line rather than rewriting the
+        old one, so dedupe by review_id keeping the latest entry — the
+        same last-write-wins the Postgres ON CONFLICT clause gives.
+        """
+        mtime = os.stat(self.json_filepath).st_mtime
+        if self._cache is not None and mtime == self._cache_mtime:
+            return self._cache
+
+        by_id = {}
+        if os.path.getsize(self.json_filepath) > 0:
+            with self._open_jsonl('rb') as f:
+                for line in f:
+                    if line.strip():
+                        review = orjson.loads(line)
+                        by_id[review.get('review_id')] = review
+
+        self._by_id = by_id
+        self._cache = list(by_id.values())
+        self._cache_mtime = mtime
+        return self._cache
     
     def get_all_reviews(self) -> List[Dict]:
         """Get all reviews from JSON"""
@@ -156,55 +386,198 @@ class DualStorage:
     
     def get_review_by_id(self, review_id: str) -> Optional[Dict]:
         """Get a specific review"""
-        reviews = self._load_json()
-        return next((r for r in reviews if r.get('review_id') == review_id), None)
+        self._load_json()  # refresh the index if the file changed
+        review = self._by_id.get(review_id)
+
+        # Not in the local file (e.g. a fresh checkout whose history
+        # lives only in the database): the UNIQUE constraint on
+        # review_id makes this a single B-tree probe
+        if review is None and self.use_postgres:
+            try:
+                review = self._get_review_postgres(review_id)
+            except Exception as e:
+                print(f"⚠ Postgres lookup failed: {e}")
+
+        return review
+
+    def _get_review_postgres(self, review_id: str) -> Optional[Dict]:
+        """Fetch one review by id from Postgres"""
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    f"SELECT {', '.join(self._PG_COLUMNS)} "
+                    "FROM llm_human_reviews WHERE review_id = %s",
+                    (review_id,)
+                )
+                row = cursor.fetchone()
+            finally:
+                cursor.close()
+
+        return dict(zip(self._PG_COLUMNS, row)) if row else None
     
     def export_for_training(self, output_file: str):
-        """Export acceptable reviews as JSONL for LLM fine-tuning"""
-        reviews = self._load_json()
-        
-        with open(output_file, 'w') as f:
-            for review in reviews:
-                # Only export acceptable responses
-                if review.get('acceptable'):
-                    training_example = {
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": review.get('prompt')
-                            },
-                            {
-                                "role": "assistant", 
-                                "content": review.get('response')
-                            }
-                        ],
-                        "metadata": {
-                            "feature": review.get('feature'),
-                            "organization": review.get('organization_name'),
-                            "reviewer": review.get('reviewer'),
-                            "timestamp": review.get('timestamp'),
-                            "notes": review.get('notes')
+        """
+        Export acceptable reviews as JSONL for LLM fine-tuning
+
+        Streams line by line instead of materializing the full review
+        list, so peak memory stays flat as the history grows. Pass one
+        records only the line number of each review_id's latest entry
+        (re-saves append, so the last line wins); pass two parses just
+        the winning acceptable lines — a byte-level check skips
+        non-acceptable records without a JSON parse.
+
+        With Postgres available the filter runs server-side instead:
+        idx_acceptable prunes rejected rows before they ever cross the
+        wire, and the result streams over a named cursor.
+        """
+        if self.use_postgres:
+            try:
+                self._export_postgres(output_file)
+                print(f"✓ Exported training data to {output_file}")
+                return
+            except Exception as e:
+                print(f"⚠ Postgres export failed, using JSON: {e}")
+
+        last_line = {}
+        with self._open_jsonl('rb') as f:
+            for lineno, line in enumerate(f):
+                match = _REVIEW_ID_RE.search(line)
+                if match:
+                    last_line[match.group(1)] = lineno
+
+        with self._open_jsonl('rb') as src, \
+                open(output_file, 'wb', buffering=1024 * 1024) as f:
+            for lineno, line in enumerate(src):
+                # orjson writes compact output, so an acceptable record
+                # always contains this exact byte sequence
+                if b'"acceptable":true' not in line:
+                    continue
+                match = _REVIEW_ID_RE.search(line)
+                if match and last_line.get(match.group(1)) != lineno:
+                    continue  # superseded by a later re-save
+
+                review = orjson.loads(line)
+                training_example = {
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": review.get('prompt')
+                        },
+                        {
+                            "role": "assistant",
+                            "content": review.get('response')
                         }
+                    ],
+                    "metadata": {
+                        "feature": review.get('feature'),
+                        "organization": review.get('organization_name'),
+                        "reviewer": review.get('reviewer'),
+                        "timestamp": review.get('timestamp'),
+                        "notes": review.get('notes')
                     }
-                    f.write(json.dumps(training_example) + '\n')
+                }
+                f.write(orjson.dumps(training_example) + b'\n')
         
         print(f"✓ Exported training data to {output_file}")
-    
+
+    def _export_postgres(self, output_file: str):
+        """Stream acceptable reviews out of Postgres as training JSONL"""
+        with self._acquire() as conn:
+            cursor = conn.cursor(name='export_training')
+            cursor.itersize = 1000
+            try:
+                cursor.execute("""
+                    SELECT prompt, response, feature, organization_name,
+                           reviewer, timestamp, notes
+                    FROM llm_human_reviews
+                    WHERE acceptable
+                """)
+
+                with open(output_file, 'wb', buffering=1024 * 1024) as f:
+                    for prompt, response, feature, org, reviewer, ts, notes in cursor:
+                        training_example = {
+                            "messages": [
+                                {"role": "user", "content": prompt},
+                                {"role": "assistant", "content": response}
+                            ],
+                            "metadata": {
+                                "feature": feature,
+                                "organization": org,
+                                "reviewer": reviewer,
+                                "timestamp": ts,
+                                "notes": notes
+                            }
+                        }
+                        f.write(orjson.dumps(training_example) + b'\n')
+            finally:
+                cursor.close()
+
     def get_stats(self) -> Dict:
         """Get review statistics"""
+        # Postgres aggregates in one round trip over indexed columns;
+        # fall back to the JSON file if the database is unreachable
+        if self.use_postgres:
+            try:
+                return self._get_stats_postgres()
+            except Exception as e:
+                print(f"⚠ Postgres stats unavailable, using JSON: {e}")
+
         reviews = self._load_json()
-        
+
         if not reviews:
             return {"total": 0}
-        
-        acceptable_count = sum(1 for r in reviews if r.get('acceptable'))
-        
+
+        # Single pass: one .get() per field per review instead of
+        # separate sum() and set-comprehension sweeps over the list
+        acceptable_count = 0
+        organizations = set()
+        reviewers = set()
+        for review in reviews:
+            if review.get('acceptable'):
+                acceptable_count += 1
+            org = review.get('organization_name')
+            if org:
+                organizations.add(org)
+            reviewer = review.get('reviewer')
+            if reviewer:
+                reviewers.add(reviewer)
+
         return {
             "total_reviews": len(reviews),
             "acceptable": acceptable_count,
             "not_acceptable": len(reviews) - acceptable_count,
-            "acceptance_rate": (acceptable_count / len(reviews) * 100) if reviews else 0,
-            "organizations": len(set(r.get('organization_name') for r in reviews if r.get('organization_name'))),
-            "reviewers": len(set(r.get('reviewer') for r in reviews if r.get('reviewer')))
+            "acceptance_rate": acceptable_count / len(reviews) * 100,
+            "organizations": len(organizations),
+            "reviewers": len(reviewers)
+        }
+
+    def _get_stats_postgres(self) -> Dict:
+        """Aggregate review statistics server-side"""
+        with self._acquire() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute("""
+                    SELECT
+                        COUNT(*),
+                        COUNT(*) FILTER (WHERE acceptable),
+                        COUNT(DISTINCT organization_name),
+                        COUNT(DISTINCT reviewer)
+                    FROM llm_human_reviews
+                """)
+                total, acceptable, organizations, reviewers = cursor.fetchone()
+            finally:
+                cursor.close()
+
+        if not total:
+            return {"total": 0}
+
+        return {
+            "total_reviews": total,
+            "acceptable": acceptable,
+            "not_acceptable": total - acceptable,
+            "acceptance_rate": acceptable / total * 100,
+            "organizations": organizations,
+            "reviewers": reviewers
         }
 
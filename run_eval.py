@@ -12,6 +12,14 @@ from dotenv import load_dotenv
 
 from eval_framework import TestRunner, TestCase, ResultsManager, get_connector
 
+# Prefer the libyaml-backed loader — same safe_load semantics, parsed
+# in C instead of pure Python. Falls back when PyYAML was built
+# without libyaml.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 # Load environment variables
 load_dotenv()
 
@@ -19,7 +27,7 @@ load_dotenv()
 def load_test_suite(yaml_path: str) -> Dict[str, Any]:
     """Load test suite from YAML file"""
     with open(yaml_path, 'r') as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def main():
@@ -4,14 +4,34 @@ Save human reviews back to PostgreSQL database
 This script takes the reviews from JSON and saves them to your Postgres database
 """
 
-import psycopg2
-import json
+from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+import io
+import orjson
 from pathlib import Path
 from datetime import datetime
 import os
-from dotenv import load_dotenv
 
-load_dotenv()
+# .env files only exist in local dev; serverless platforms inject env
+# vars directly, so skip the filesystem walk on cold starts
+if not os.getenv('VERCEL'):
+    from dotenv import load_dotenv
+    load_dotenv()
+
+
+def _tags_literal(tags):
+    """
+    Render a tags list as a Postgres array literal, e.g. {"a","b"}
+
+    Sent as plain text with a ::text[] cast, so psycopg2 skips its
+    per-element Python-list-to-array adaption on every row.
+    """
+    return '{' + ','.join(
+        '"' + t.replace('\\', '\\\\').replace('"', '\\"') + '"'
+        for t in tags or []
+    ) + '}'
 
 
 class ReviewDatabaseSaver:
@@ -21,20 +41,41 @@ class ReviewDatabaseSaver:
         self.connection_string = connection_string or os.getenv('POSTGRES_URL')
         if not self.connection_string:
             raise ValueError("POSTGRES_URL not found. Set it in .env file")
-    
+        # Lazily built pool of long-lived connections — the TCP + auth
+        # handshake would otherwise dominate each small INSERT
+        self._pool = None
+
+    @contextmanager
     def connect(self):
-        """Create database connection"""
-        return psycopg2.connect(self.connection_string)
+        """
+        Check a connection out of the shared pool
+
+        Usage:
+            with saver.connect() as conn:
+                ...
+        """
+        if self._pool is None:
+            self._pool = ThreadedConnectionPool(
+                1, 8, self.connection_string,
+                # Keepalive probes so idle pooled connections survive
+                # NAT/firewall timeouts
+                keepalives=1, keepalives_idle=30
+            )
+        conn = self._pool.getconn()
+        try:
+            yield conn
+        finally:
+            self._pool.putconn(conn)
     
     def create_reviews_table(self):
         """
         Create the human_reviews table if it doesn't exist
         """
-        conn = self.connect()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
+        with self.connect() as conn:
+            cursor = conn.cursor()
+
+            try:
+                cursor.execute("""
                 CREATE TABLE IF NOT EXISTS llm_human_reviews (
                     id SERIAL PRIMARY KEY,
                     review_id VARCHAR(255) UNIQUE NOT NULL,
@@ -64,88 +105,205 @@ class ReviewDatabaseSaver:
                 CREATE INDEX IF NOT EXISTS idx_acceptable ON llm_human_reviews(acceptable);
                 CREATE INDEX IF NOT EXISTS idx_feature ON llm_human_reviews(feature);
             """)
-            
-            conn.commit()
-            print("✓ Reviews table created/verified")
-        
-        finally:
-            cursor.close()
-            conn.close()
-    
+
+                conn.commit()
+                print("✓ Reviews table created/verified")
+
+            finally:
+                cursor.close()
+
+    COLUMNS = (
+        'review_id', 'timestamp', 'reviewer',
+        'prompt', 'context', 'response', 'expected_output',
+        'model', 'feature',
+        'acceptable', 'score_choice', 'notes', 'tags'
+    )
+
+    UPSERT_SQL = (
+        "INSERT INTO llm_human_reviews ("
+        + ", ".join(COLUMNS) +
+        ") VALUES %s "
+        "ON CONFLICT (review_id) DO UPDATE SET "
+        "acceptable = EXCLUDED.acceptable, "
+        "score_choice = EXCLUDED.score_choice, "
+        "notes = EXCLUDED.notes, "
+        "tags = EXCLUDED.tags"
+    )
+
+    # Explicit row template so the tags literal string is cast
+    # server-side instead of adapted per row by psycopg2
+    VALUES_TEMPLATE = (
+        "(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s::text[])"
+    )
+
     def save_review(self, review_data):
         """
         Save a single review to database
-        
+
         Args:
             review_data: Review dictionary
         """
-        conn = self.connect()
-        cursor = conn.cursor()
-        
-        try:
-            cursor.execute("""
-                INSERT INTO llm_human_reviews (
-                    review_id, timestamp, reviewer,
-                    prompt, context, response, expected_output,
-                    model, feature,
-                    acceptable, score_choice, notes, tags
-                ) VALUES (
-                    %s, %s, %s,
-                    %s, %s, %s, %s,
-                    %s, %s,
-                    %s, %s, %s, %s
+        self.save_reviews_bulk([review_data])
+
+    def save_reviews_bulk(self, reviews):
+        """
+        Upsert many reviews in one batch
+
+        execute_values sends multi-row INSERTs of up to 1000 rows, so a
+        full sync costs a handful of round trips instead of one per row.
+
+        Args:
+            reviews: List of review dictionaries
+
+        Returns:
+            Number of reviews sent
+        """
+        if not reviews:
+            return 0
+
+        rows = [
+            tuple(
+                _tags_literal(review.get('tags')) if col == 'tags'
+                else review.get(col)
+                for col in self.COLUMNS
+            )
+            for review in reviews
+        ]
+
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            try:
+                execute_values(
+                    cursor, self.UPSERT_SQL, rows,
+                    template=self.VALUES_TEMPLATE, page_size=1000
                 )
-                ON CONFLICT (review_id) DO UPDATE SET
-                    acceptable = EXCLUDED.acceptable,
-                    score_choice = EXCLUDED.score_choice,
-                    notes = EXCLUDED.notes,
-                    tags = EXCLUDED.tags
-            """, (
-                review_data.get('review_id'),
-                review_data.get('timestamp'),
-                review_data.get('reviewer'),
-                review_data.get('prompt'),
-                review_data.get('context'),
-                review_data.get('response'),
-                review_data.get('expected_output'),
-                review_data.get('model'),
-                review_data.get('feature'),
-                review_data.get('acceptable'),
-                review_data.get('score_choice'),
-                review_data.get('notes'),
-                review_data.get('tags', [])
-            ))
-            
-            conn.commit()
-        
-        finally:
-            cursor.close()
-            conn.close()
-    
+                conn.commit()
+                return len(rows)
+            except Exception:
+                # Roll back so the pooled connection isn't returned stuck
+                # in an aborted transaction
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    @staticmethod
+    def _copy_escape(value):
+        r"""Escape one field for PostgreSQL COPY text format"""
+        if value is None:
+            return r'\N'
+        return (
+            str(value)
+            .replace('\\', '\\\\')
+            .replace('\t', '\\t')
+            .replace('\n', '\\n')
+            .replace('\r', '\\r')
+        )
+
+    def _copy_upsert(self, reviews):
+        """
+        Bulk-load reviews via COPY into a temp table, then merge
+
+        COPY streams every row in a single command, so ingest is bound
+        by bandwidth rather than per-statement round trips; the merge
+        into llm_human_reviews is one more statement with the same
+        ON CONFLICT behavior as save_review.
+
+        Args:
+            reviews: List of review dictionaries (unique review_ids)
+
+        Returns:
+            Number of rows merged
+        """
+        buf = io.StringIO()
+        for review in reviews:
+            fields = []
+            for col in self.COLUMNS:
+                if col == 'tags':
+                    # Array literal; the whole string then goes through
+                    # COPY escaping like any other field
+                    value = _tags_literal(review.get('tags'))
+                else:
+                    value = review.get(col)
+                fields.append(self._copy_escape(value))
+            buf.write('\t'.join(fields) + '\n')
+        buf.seek(0)
+
+        cols = ', '.join(self.COLUMNS)
+        with self.connect() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(
+                    "CREATE TEMP TABLE reviews_staging "
+                    "(LIKE llm_human_reviews INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                cursor.copy_expert(f"COPY reviews_staging ({cols}) FROM STDIN", buf)
+                cursor.execute(f"""
+                    INSERT INTO llm_human_reviews ({cols})
+                    SELECT {cols} FROM reviews_staging
+                    ON CONFLICT (review_id) DO UPDATE SET
+                        acceptable = EXCLUDED.acceptable,
+                        score_choice = EXCLUDED.score_choice,
+                        notes = EXCLUDED.notes,
+                        tags = EXCLUDED.tags
+                """)
+                merged = cursor.rowcount
+                conn.commit()
+                return merged
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+
     def sync_from_json(self):
         """
         Load all reviews from JSON and save to database
         """
+        # DualStorage writes JSONL since the append-only change; fall
+        # back to the legacy array file if that's all that exists
+        jsonl_file = Path("review_data/reviews.jsonl")
         reviews_file = Path("review_data/reviews.json")
-        
-        if not reviews_file.exists():
+
+        if jsonl_file.exists():
+            # Dedupe by review_id (re-saves append a new line) — a
+            # repeated id within one merge would abort the upsert
+            by_id = {}
+            with open(jsonl_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        review = orjson.loads(line)
+                        by_id[review.get('review_id')] = review
+            reviews = list(by_id.values())
+        elif reviews_file.exists():
+            with open(reviews_file, 'rb') as f:
+                reviews = orjson.loads(f.read())
+        else:
             print("No reviews file found")
             return
-        
-        with open(reviews_file) as f:
-            reviews = json.load(f)
-        
+
         print(f"Syncing {len(reviews)} reviews to database...")
-        
-        for i, review in enumerate(reviews, 1):
-            try:
-                self.save_review(review)
-                if i % 10 == 0:
-                    print(f"  Synced {i}/{len(reviews)}")
-            except Exception as e:
-                print(f"  Error syncing review {review.get('review_id')}: {e}")
-        
-        print(f"✓ Sync complete: {len(reviews)} reviews")
+
+        # Large syncs split across pooled connections: psycopg2 drops
+        # the GIL during network I/O, so concurrent COPY streams overlap
+        # their round trips. Chunks hold disjoint review_ids (deduped
+        # above), so the parallel merges can't contend on the same rows.
+        chunk_size = 5000
+        try:
+            if len(reviews) <= chunk_size:
+                synced = self._copy_upsert(reviews)
+            else:
+                chunks = [
+                    reviews[i:i + chunk_size]
+                    for i in range(0, len(reviews), chunk_size)
+                ]
+                with ThreadPoolExecutor(max_workers=min(4, len(chunks))) as pool:
+                    synced = sum(pool.map(self._copy_upsert, chunks))
+        except Exception as e:
+            print(f"  Error syncing reviews: {e}")
+            return
+
+        print(f"✓ Sync complete: {synced} reviews")
 
 
 def main():
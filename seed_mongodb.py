@@ -8,7 +8,7 @@ Environment Variables:
     MONGODB_URI - MongoDB connection string
 """
 
-import json
+import orjson
 import os
 from pathlib import Path
 from pymongo import MongoClient
@@ -17,6 +17,18 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+def _insert_chunked(collection, docs, batch_size=10000):
+    """Insert documents in unordered batches; returns count inserted"""
+    inserted = 0
+    for start in range(0, len(docs), batch_size):
+        batch = docs[start:start + batch_size]
+        # ordered=False lets the server process the batch in parallel
+        # and keeps one bad document from aborting the rest
+        result = collection.insert_many(batch, ordered=False)
+        inserted += len(result.inserted_ids)
+    return inserted
+
+
 def seed_mongodb():
     """Upload pending reviews to MongoDB"""
     
@@ -29,14 +41,23 @@ def seed_mongodb():
     
     # Load local data
     pending_file = Path("review_data/pending_reviews.json")
-    
+
     if not pending_file.exists():
         print("❌ Error: review_data/pending_reviews.json not found")
         print("Run: python load_from_postgres.py first")
         return False
+
+    # Fold any un-compacted OpenGov captures into the array first, so
+    # responses still sitting in the JSONL sidecar make it to MongoDB
+    from opengov_integration import OpenGovReviewCapture
+    folded = OpenGovReviewCapture(str(pending_file)).compact()
+    if folded:
+        print(f"📥 Folded {folded} captured reviews into the queue")
     
-    with open(pending_file) as f:
-        reviews = json.load(f)
+    # orjson parses the queue in C — noticeably faster once the file
+    # holds a few thousand reviews
+    with open(pending_file, 'rb') as f:
+        reviews = orjson.loads(f.read())
     
     if not reviews:
         print("❌ No reviews found in pending_reviews.json")
@@ -49,18 +70,19 @@ def seed_mongodb():
         client = MongoClient(mongodb_uri)
         db = client['llm_reviews']
         
-        # Clear existing pending reviews
-        db['pending_reviews'].delete_many({})
+        # Clear existing pending reviews: drop() is one server command,
+        # unlike delete_many which removes (and unindexes) per document
+        db['pending_reviews'].drop()
         print("🗑️  Cleared existing pending reviews")
-        
+
         # Insert new reviews
-        result = db['pending_reviews'].insert_many(reviews)
-        print(f"✅ Uploaded {len(result.inserted_ids)} reviews to MongoDB")
-        
+        uploaded = _insert_chunked(db['pending_reviews'], reviews)
+        print(f"✅ Uploaded {uploaded} reviews to MongoDB")
+
         # Also create/update backup for reset functionality
-        db['backup_reviews'].delete_many({})
-        db['backup_reviews'].insert_many(reviews)
-        print(f"💾 Created backup of {len(reviews)} reviews (for reset)")
+        db['backup_reviews'].drop()
+        backed_up = _insert_chunked(db['backup_reviews'], reviews)
+        print(f"💾 Created backup of {backed_up} reviews (for reset)")
         
         # Show summary
         print(f"\n📊 Summary:")
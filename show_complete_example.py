@@ -9,54 +9,67 @@ POSTGRES_URL = "postgresql://usr_teleport_reader@localhost:51329/procurement_pro
 conn = psycopg2.connect(POSTGRES_URL)
 cursor = conn.cursor()
 
-# Get an AI audit with descriptions
+# One query, one round trip: the audit row used to be fetched first and
+# its project_id fed into a second execute — two serial waits on the
+# server. A CTE seeds the audit and the join fans out to its section
+# descriptions server-side. The named cursor streams rows in 1000-tuple
+# fetches and left(..., 500) truncates on the server, so only the
+# preview actually crosses the wire.
+cursor.close()
+cursor = conn.cursor(name='example_cursor')
+cursor.itersize = 1000
 cursor.execute("""
-    SELECT a.id, a.prompt, a.project_id
-    FROM ai_audit a
-    WHERE a.id = 9218
-""")
-
-ai_id, prompt, project_id = cursor.fetchone()
-
-print("="*70)
-print("COMPLETE AI INTERACTION EXAMPLE")
-print("="*70)
-
-print(f"\n📝 AI Audit ID: {ai_id}")
-print(f"\n💬 USER PROMPT:")
-print(f"   {prompt}")
-
-print(f"\n🎯 PROJECT ID: {project_id}")
-
-# Get all section descriptions for this project
-cursor.execute("""
-    SELECT 
+    WITH audit AS (
+        SELECT id, prompt, project_id
+        FROM ai_audit
+        WHERE id = 9218
+    )
+    SELECT
+        audit.id,
+        audit.prompt,
+        audit.project_id,
         ps.title as section_title,
         pss.title as subsection_title,
-        sd.description,
+        left(sd.description, 500) as description,
         sd.created_at
-    FROM section_description sd
+    FROM audit
+    LEFT JOIN section_description sd ON sd.project_id = audit.project_id
     LEFT JOIN project_section ps ON sd.project_section_id = ps.id
     LEFT JOIN project_subsection pss ON sd.project_subsection_id = pss.id
-    WHERE sd.project_id = %s
     ORDER BY sd.created_at
-""", (project_id,))
-
-descriptions = cursor.fetchall()
+""")
 
-print(f"\n🤖 AI RESPONSES ({len(descriptions)} sections generated):")
+print("="*70)
+print("COMPLETE AI INTERACTION EXAMPLE")
 print("="*70)
 
-for i, (sec_title, subsec_title, description, created_at) in enumerate(descriptions, 1):
+count = 0
+header_printed = False
+for ai_id, prompt, project_id, sec_title, subsec_title, desc_preview, created_at in cursor:
+    if not header_printed:
+        header_printed = True
+        # Audit columns repeat on every row; print them once
+        print(f"\n📝 AI Audit ID: {ai_id}")
+        print(f"\n💬 USER PROMPT:")
+        print(f"   {prompt}")
+        print(f"\n🎯 PROJECT ID: {project_id}")
+        print(f"\n🤖 AI RESPONSES (sections generated):")
+        print("="*70)
+
+    if created_at is None:
+        continue  # audit exists but has no section descriptions
+
+    count += 1
     title = subsec_title or sec_title or "Unknown"
-    print(f"\n{i}. {title}")
+    print(f"\n{count}. {title}")
     print(f"   Created: {created_at}")
-    if description:
-        # Show first 500 chars
-        desc_preview = description[:500]
+    if desc_preview:
         print(f"   Content: {desc_preview}...")
         print()
 
+print(f"\nTotal sections: {count}")
+
+cursor.close()
 conn.close()
 
 print("\n" + "="*70)
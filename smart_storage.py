@@ -6,7 +6,7 @@ Environment detection:
 - Production (Vercel/etc): MongoDB (persistent)
 """
 
-import json
+import heapq
 import os
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -75,20 +75,25 @@ class SmartStorage:
         if not reviews:
             return {"total": 0}
         
-        acceptable_count = sum(1 for r in reviews if r.get('acceptable'))
-        
-        # Get unique values
+        # Single pass over the list: one .get() per field per review
+        # instead of a sum() sweep plus repeated lookups per row
+        acceptable_count = 0
         organizations = set()
         reviewers = set()
         features = set()
-        
+
         for r in reviews:
-            if r.get('organization_name'):
-                organizations.add(r.get('organization_name'))
-            if r.get('reviewer'):
-                reviewers.add(r.get('reviewer'))
-            if r.get('feature'):
-                features.add(r.get('feature'))
+            if r.get('acceptable'):
+                acceptable_count += 1
+            org = r.get('organization_name')
+            if org:
+                organizations.add(org)
+            reviewer = r.get('reviewer')
+            if reviewer:
+                reviewers.add(reviewer)
+            feature = r.get('feature')
+            if feature:
+                features.add(feature)
         
         return {
             "total_reviews": len(reviews),
@@ -109,11 +114,7 @@ class SmartStorage:
     def get_recent_reviews(self, limit: int = 20) -> List[Dict]:
         """Get most recent reviews"""
         reviews = self.get_all_reviews()
-        # Sort by timestamp descending
-        sorted_reviews = sorted(
-            reviews, 
-            key=lambda x: x.get('timestamp', ''), 
-            reverse=True
-        )
-        return sorted_reviews[:limit]
+        # Top-K by timestamp: O(N log K) heap selection instead of
+        # sorting (and copying) the entire list for 20 rows
+        return heapq.nlargest(limit, reviews, key=lambda x: x.get('timestamp', ''))
 
@@ -0,0 +1,60 @@
+-- Indexes that speed up the AI-usage inference queries
+-- (infer_ai_usage.py, load_from_postgres.py)
+--
+-- The scripts connect with a read-only role and cannot create indexes
+-- themselves; ask a DBA to apply this file against the procurement
+-- database:
+--
+--     psql "$POSTGRES_URL_ADMIN" -f sql/indexes.sql
+
+-- Both scripts filter criteria with:
+--     description IS NOT NULL AND octet_length(description) > 100
+-- join on project_section_id, and range on created_at relative to the
+-- driving ai_audit row. octet_length reads the stored byte count from
+-- the varlena header instead of walking the UTF-8 string (and never
+-- detoasts); the partial predicate means the planner scans only
+-- long-description rows without re-evaluating the filter, and the
+-- trailing created_at column bounds the inner side of the join to the
+-- 15-minute window instead of re-reading every criteria row per
+-- section. Supersedes the single-column idx_criteria_desc_long.
+DROP INDEX IF EXISTS idx_criteria_desc_long;
+CREATE INDEX IF NOT EXISTS criteria_section_created_idx
+    ON criteria (project_section_id, created_at)
+    WHERE description IS NOT NULL AND octet_length(description) > 100;
+
+-- test_query.py joins ai_audit to section_description on project_id,
+-- ranges on created_at, and keeps rows with more than 50 bytes of
+-- description. The partial index serves the join key, the time range,
+-- and the length filter together.
+CREATE INDEX IF NOT EXISTS section_description_long_idx
+    ON section_description (project_id, created_at)
+    WHERE description IS NOT NULL AND octet_length(description) > 50;
+
+-- verify_ai_content.py joins section_description by project_id with
+-- only description IS NOT NULL (no byte-length filter), which the
+-- stricter partial index above cannot serve.
+CREATE INDEX IF NOT EXISTS section_description_proj_created_idx
+    ON section_description (project_id, created_at)
+    WHERE description IS NOT NULL;
+
+-- verify_ai_content.py probes ai_audit by project_id in EXISTS
+-- subqueries, and every time-proximity query ranges on a.created_at
+-- (the window joins and the ORDER BY created_at DESC LIMIT scans).
+-- Supersedes the single-column ai_audit_project_id_idx; the leading
+-- project_id column still serves the EXISTS probes.
+DROP INDEX IF EXISTS ai_audit_project_id_idx;
+CREATE INDEX IF NOT EXISTS ai_audit_proj_created_idx
+    ON ai_audit (project_id, created_at);
+
+-- The loader drives its join from government.code = 'sampleville'; a
+-- covering index lets that seed lookup return id and organization_id
+-- without touching the heap.
+CREATE INDEX IF NOT EXISTS idx_government_code
+    ON government (code)
+    INCLUDE (id, organization_id);
+
+-- Refresh statistics so the planner picks the new indexes immediately
+ANALYZE criteria;
+ANALYZE section_description;
+ANALYZE ai_audit;
+ANALYZE government;
@@ -3,30 +3,58 @@
 Quick test to verify installation is working correctly
 """
 
+import importlib.util
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+class _ThreadOutput:
+    """
+    Route print() from worker threads into per-thread buffers
+
+    The tests run concurrently and all print progress; interleaved
+    lines would be unreadable, so each thread writes to its own buffer
+    and main() replays them in test order once everything finishes.
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.buffers = {}
+
+    def write(self, text):
+        buf = self.buffers.get(threading.get_ident())
+        (buf if buf is not None else self.fallback).write(text)
+
+    def flush(self):
+        self.fallback.flush()
+
+
+# (import name, pip package) pairs, hoisted so test_imports doesn't
+# rebuild the lists on every call
+_REQUIRED_PACKAGES = (
+    ('yaml', 'pyyaml'),
+    ('dotenv', 'python-dotenv'),
+    ('rich', 'rich'),
+)
+
+_OPTIONAL_PACKAGES = (
+    ('openai', 'openai'),
+    ('anthropic', 'anthropic'),
+    ('sentence_transformers', 'sentence-transformers'),
+    ('sklearn', 'scikit-learn'),
+)
 
 
 def test_imports():
     """Test that all required packages can be imported"""
     print("Testing imports...")
-    
-    required_packages = [
-        ('yaml', 'pyyaml'),
-        ('dotenv', 'python-dotenv'),
-        ('rich', 'rich'),
-    ]
-    
-    optional_packages = [
-        ('openai', 'openai'),
-        ('anthropic', 'anthropic'),
-        ('sentence_transformers', 'sentence-transformers'),
-        ('sklearn', 'scikit-learn'),
-    ]
-    
+
     failed = []
-    
+
     # Test required packages
-    for module, package in required_packages:
+    for module, package in _REQUIRED_PACKAGES:
         try:
             __import__(module)
             print(f"  ✓ {package}")
@@ -34,12 +62,15 @@ def test_imports():
             print(f"  ✗ {package} - REQUIRED")
             failed.append(package)
     
-    # Test optional packages
-    for module, package in optional_packages:
-        try:
-            __import__(module)
+    # Test optional packages. find_spec only checks the importer path —
+    # actually importing e.g. sentence_transformers pulls in torch and
+    # adds seconds to this test for a yes/no answer. The required
+    # packages above stay on real __import__ so broken installs (e.g.
+    # failing C extensions) are still caught.
+    for module, package in _OPTIONAL_PACKAGES:
+        if importlib.util.find_spec(module) is not None:
             print(f"  ✓ {package}")
-        except ImportError:
+        else:
             print(f"  ⚠ {package} - optional (install for full functionality)")
     
     return len(failed) == 0
@@ -69,12 +100,27 @@ def test_framework():
         
         runner = TestRunner(connector, verbose=False)
         result = runner.run_test(test_case)
-        
-        if result.passed:
-            print("  ✓ Test execution successful")
+
+        if not result.passed:
+            print("  ✗ Test execution failed")
+            return False
+        print("  ✓ Test execution successful")
+
+        # A small batch through the same runner — all 100 cases hit the
+        # shared evaluator instances rather than building one per case
+        batch = [
+            TestCase(
+                name=f"Installation batch {i}",
+                input="test",
+                evaluators=[{"type": "contains", "value": "Test"}]
+            )
+            for i in range(100)
+        ]
+        if all(runner.run_test(case).passed for case in batch):
+            print("  ✓ Batch execution successful (100 cases)")
             return True
         else:
-            print("  ✗ Test execution failed")
+            print("  ✗ Batch execution failed")
             return False
             
     except Exception as e:
@@ -89,14 +135,21 @@ def test_yaml_loading():
     try:
         import yaml
         from pathlib import Path
-        
+
+        # libyaml-backed loader when available (same safe_load
+        # semantics, C parser); pure-Python fallback otherwise
+        try:
+            from yaml import CSafeLoader as yaml_loader
+        except ImportError:
+            from yaml import SafeLoader as yaml_loader
+
         test_file = Path("test_cases/example.yaml")
         if not test_file.exists():
             print("  ⚠ Example test case file not found")
             return True  # Not a critical error
-        
+
         with open(test_file) as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=yaml_loader)
         
         if 'test_cases' in data and len(data['test_cases']) > 0:
             print(f"  ✓ Loaded {len(data['test_cases'])} test cases from example.yaml")
@@ -115,19 +168,21 @@ def test_results_dir():
     print("\nTesting results directory...")
     
     try:
+        import os
         from pathlib import Path
-        
+
         results_dir = Path("results")
         if not results_dir.exists():
             results_dir.mkdir()
             print("  ✓ Created results directory")
         else:
             print("  ✓ Results directory exists")
-        
-        # Test write permissions
-        test_file = results_dir / ".test_write"
-        test_file.write_text("test")
-        test_file.unlink()
+
+        # Check write permissions without mutating the filesystem — a
+        # single access(2) call instead of creating and unlinking a
+        # probe file (which is especially slow on network filesystems)
+        if not os.access(results_dir, os.W_OK):
+            raise PermissionError(f"{results_dir} is not writable")
         print("  ✓ Results directory is writable")
         
         return True
@@ -151,13 +206,35 @@ def main():
     
     passed = 0
     failed = 0
-    
-    for name, test_func in tests:
-        if test_func():
+
+    # The tests are independent and mostly I/O-bound (module imports,
+    # YAML read, filesystem checks), so they run in parallel — wall
+    # time drops to roughly the slowest test instead of the sum
+    out = _ThreadOutput(sys.stdout)
+
+    def run_buffered(test_func):
+        buf = io.StringIO()
+        out.buffers[threading.get_ident()] = buf
+        try:
+            return test_func(), buf
+        finally:
+            out.buffers.pop(threading.get_ident(), None)
+
+    original_stdout = sys.stdout
+    sys.stdout = out
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(run_buffered, [func for _, func in tests]))
+    finally:
+        sys.stdout = original_stdout
+
+    for ok, buf in results:
+        print(buf.getvalue(), end='')
+        if ok:
             passed += 1
         else:
             failed += 1
-    
+
     print("\n" + "="*60)
     if failed == 0:
         print("✓ All tests passed! Installation is working correctly.")
@@ -1,17 +1,23 @@
 import psycopg2
 
 conn = psycopg2.connect('postgresql://usr_teleport_reader@localhost:51329/procurement_prod')
+# Pure SELECTs: autocommit skips the implicit BEGIN/COMMIT wrapping of
+# every execute, and read-only lets the server treat each statement as
+# a single-shot read
+conn.set_session(readonly=True, autocommit=True)
 cursor = conn.cursor()
 
-# Test the exact query
+# Test the exact query. The columns are already timestamp; comparing
+# them bare (no ::timestamp on the column side) keeps the predicate
+# sargable so a (project_id, created_at) index can range-scan it
 query = """
 SELECT COUNT(*) 
 FROM ai_audit a
 JOIN section_description sd ON a.project_id = sd.project_id
-WHERE sd.created_at::timestamp > a.created_at::timestamp
-  AND sd.created_at::timestamp < (a.created_at::timestamp + INTERVAL '1 hour')
+WHERE sd.created_at > a.created_at
+  AND sd.created_at < (a.created_at + INTERVAL '1 hour')
   AND sd.description IS NOT NULL
-  AND LENGTH(sd.description) > 50
+  AND octet_length(sd.description) > 50
 """
 
 cursor.execute(query)
@@ -23,8 +29,8 @@ query2 = """
 SELECT a.id, a.prompt, a.created_at, sd.created_at
 FROM ai_audit a
 JOIN section_description sd ON a.project_id = sd.project_id
-WHERE sd.created_at::timestamp > a.created_at::timestamp
-  AND sd.created_at::timestamp < (a.created_at::timestamp + INTERVAL '1 hour')
+WHERE sd.created_at > a.created_at
+  AND sd.created_at < (a.created_at + INTERVAL '1 hour')
   AND sd.description IS NOT NULL
 LIMIT 5
 """
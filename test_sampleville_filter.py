@@ -7,45 +7,82 @@ Run this before deploying to verify only Sampleville data is loaded.
 
 import psycopg2
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
 
-load_dotenv()
+SAMPLEVILLE = 'sampleville'
 
 
-def test_sampleville_filter():
+@lru_cache(maxsize=1)
+def _pg_url():
+    """Load .env once, on first use, and cache the connection URL"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv('POSTGRES_URL')
+
+
+@lru_cache(maxsize=1)
+def _get_conn():
+    """
+    One shared connection for the whole script run
+
+    Each psycopg2.connect is a full TCP + startup + auth round trip;
+    the code-listing check and the filter test can reuse a single one.
+    """
+    conn = psycopg2.connect(_pg_url())
+    # Read-only transactions; autocommit stays off because the SET
+    # LOCAL planner guards only apply inside a transaction
+    conn.set_session(readonly=True)
+    return conn
+
+
+def test_sampleville_filter(conn=None):
     """Test that the query only returns Sampleville data"""
-    
-    postgres_url = os.getenv('POSTGRES_URL')
-    
+
+    postgres_url = _pg_url()
+
     if not postgres_url:
         print("❌ POSTGRES_URL not found in .env file")
         print("Please set POSTGRES_URL in your .env file")
         return False
-    
+
     try:
-        print("Connecting to database...")
-        conn = psycopg2.connect(postgres_url)
+        if conn is None:
+            print("Connecting to database...")
+            conn = _get_conn()
         cursor = conn.cursor()
         
-        # Test the actual query with Sampleville filter
+        # Test the actual query with Sampleville filter. The CTE pins
+        # the highly selective government/project filter before any
+        # ai_audit rows are touched, and the EXISTS is a semi-join: the
+        # old section/criteria joins fanned each audit out to every
+        # matching criteria row just so GROUP BY could collapse the
+        # duplicates again, whereas EXISTS stops at the first in-window
+        # criteria match per audit and needs no aggregation.
         test_query = """
-        SELECT 
+        WITH sv_projects AS (
+            SELECT p.id, p.title, g.code, o.name AS org_name
+            FROM government g
+            LEFT JOIN organization o ON g.organization_id = o.id
+            JOIN project p ON p.government_id = g.id
+            WHERE g.code = 'sampleville'
+        )
+        SELECT
             a.id as ai_audit_id,
-            p.title as user_prompt,
-            COALESCE(o.name, 'Unknown Organization') as organization_name,
-            g.code as government_code
-        FROM ai_audit a
-        JOIN project p ON a.project_id = p.id
-        JOIN government g ON p.government_id = g.id
-        LEFT JOIN organization o ON g.organization_id = o.id
-        JOIN project_section ps ON p.id = ps.project_id
-        JOIN criteria c ON ps.id = c.project_section_id
-        WHERE c.created_at::timestamp BETWEEN a.created_at::timestamp 
-              AND (a.created_at::timestamp + INTERVAL '15 minutes')
-          AND c.description IS NOT NULL
-          AND LENGTH(c.description) > 100
-          AND g.code = 'sampleville'
-        GROUP BY a.id, p.title, o.name, g.code
+            left(svp.title, 50) as user_prompt,
+            COALESCE(svp.org_name, 'Unknown Organization') as organization_name,
+            lower(svp.code) as government_code
+        FROM sv_projects svp
+        JOIN ai_audit a ON a.project_id = svp.id
+        WHERE EXISTS (
+            SELECT 1
+            FROM project_section ps
+            JOIN criteria c ON c.project_section_id = ps.id
+            WHERE ps.project_id = svp.id
+              AND c.created_at BETWEEN a.created_at
+                  AND (a.created_at + INTERVAL '15 minutes')
+              AND c.description IS NOT NULL
+              AND octet_length(c.description) > 100
+        )
         LIMIT 10
         """
         
@@ -53,6 +90,17 @@ def test_sampleville_filter():
         print("\nTesting Sampleville filter...")
         print("-" * 60)
         
+        # Planner guards, scoped to this transaction by SET LOCAL: the
+        # timeout caps a runaway plan, and collapse_limit = 1 makes the
+        # planner keep the written join order — the query lists the
+        # Sampleville-filtered side first, so the small hash table is
+        # built from that side instead of being re-derived by join-order
+        # search across all the tables.
+        cursor.execute(
+            "SET LOCAL statement_timeout = '30s'; "
+            "SET LOCAL join_collapse_limit = 1; "
+            "SET LOCAL from_collapse_limit = 1"
+        )
         cursor.execute(test_query)
         results = cursor.fetchall()
         
@@ -91,13 +139,15 @@ def test_sampleville_filter():
         
         all_sampleville = True
         for i, (aid, title, org, gov_code) in enumerate(results, 1):
-            # Truncate long titles
-            title_display = title[:50] + "..." if len(title) > 50 else title
+            # Titles arrive pre-truncated to 50 chars and codes
+            # pre-lowercased by the SQL projection, so the loop does no
+            # per-row string work
+            title_display = title + "..." if len(title) == 50 else title
             print(f"\n{i}. Project: {title_display}")
             print(f"   Organization: {org}")
             print(f"   Government Code: {gov_code}")
-            
-            if gov_code.lower() != 'sampleville':
+
+            if gov_code != SAMPLEVILLE:
                 print(f"   ❌ WARNING: This is not Sampleville!")
                 all_sampleville = False
         
@@ -120,54 +170,55 @@ def test_sampleville_filter():
         return False
     
     finally:
+        # The shared connection stays open for the caller; __main__
+        # closes it once both checks are done
         if 'cursor' in locals():
             cursor.close()
-        if 'conn' in locals():
-            conn.close()
 
 
-def check_government_codes():
+def check_government_codes(conn=None):
     """Check what government codes exist in the database"""
-    
-    postgres_url = os.getenv('POSTGRES_URL')
-    
+
+    postgres_url = _pg_url()
+
     if not postgres_url:
         return
-    
+
     try:
-        conn = psycopg2.connect(postgres_url)
+        if conn is None:
+            conn = _get_conn()
         cursor = conn.cursor()
         
         print("\n" + "=" * 60)
         print("Available Government Codes in Database")
         print("=" * 60)
         
-        # Try to get government codes
+        # Try to get government codes; lower(code) comes back as its own
+        # column so the comparisons below don't re-lowercase per row
         cursor.execute("""
-            SELECT DISTINCT code, name
+            SELECT DISTINCT code, name, lower(code) as code_lower
             FROM government
             WHERE code IS NOT NULL
             ORDER BY code
             LIMIT 20
         """)
-        
+
         results = cursor.fetchall()
-        
+
         if results:
             print("\nFound these government codes:")
-            for code, name in results:
-                marker = "✓" if code.lower() == 'sampleville' else " "
+            for code, name, code_lower in results:
+                marker = "✓" if code_lower == SAMPLEVILLE else " "
                 print(f"  {marker} {code} - {name}")
-            
-            if not any(code.lower() == 'sampleville' for code, _ in results):
+
+            if not any(code_lower == SAMPLEVILLE for _, _, code_lower in results):
                 print("\n⚠️  'sampleville' not found in the government codes")
                 print("You may need to use a different government code in the filter")
         else:
             print("No government codes found or column name is different")
-        
+
         cursor.close()
-        conn.close()
-        
+
     except Exception as e:
         print(f"Could not check government codes: {e}")
 
@@ -184,7 +235,13 @@ if __name__ == '__main__':
     # Then test the filter
     print()
     success = test_sampleville_filter()
-    
+
+    # Both checks share one connection; close it now that we're done
+    try:
+        _get_conn().close()
+    except Exception:
+        pass
+
     print("\n" + "=" * 60)
     if success:
         print("✅ READY TO DEPLOY")